@@ -25,6 +25,7 @@ from pydantic import BaseModel
 import uvicorn
 from dotenv import load_dotenv
 
+from common_logging import configure_async_logging, stop_async_logging
 from tools import CalendarTool
 from agents.calendar_agent import CalendarAgent
 from data.mcp_client import MCPClient
@@ -85,6 +86,8 @@ class MCPDataRequest(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application components."""
+    # Run log handlers on a listener thread for the life of the server
+    configure_async_logging()
     logger.info("Starting EmailPilot Simple API...")
 
     # Validate environment variables
@@ -159,6 +162,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down EmailPilot Simple API...")
     await mcp_client.__aexit__(None, None, None)
     logger.info("Cleanup complete")
+    stop_async_logging()
 
 
 # Create FastAPI app
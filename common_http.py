@@ -0,0 +1,38 @@
+"""
+Shared HTTP client for the Calendar App push scripts.
+
+push_calendar_to_app.py and push_enriched_calendar.py both POST to the
+Calendar App; routing them through one pooled client lets pushes made from
+the same process reuse the keep-alive connection.
+"""
+
+import httpx
+from typing import Optional
+
+# Shared keep-alive client, created on first use
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            # Pool limits live on the transport: AsyncClient ignores limits= once
+            # a transport is given. Retries cover failed connection attempts
+            # only; requests are never replayed
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+            )
+        )
+    return _CLIENT
+
+
+async def close_client():
+    """Close the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
@@ -0,0 +1,67 @@
+"""
+Shared JSON helpers for the workflow scripts and tools.
+
+Parsing and serialization go through orjson when it is installed; ujson is a
+loads-only fallback, and the stdlib json module is used otherwise. Every
+serializer here returns UTF-8 encoded bytes, ready to write to a binary file
+or send as a request body; call .decode() where a str is needed for display.
+The stdlib fallback is configured to match orjson's output byte for byte on
+ordinary data (non-ASCII text is written as raw UTF-8, not \\uXXXX escapes).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Loads-only fallback where orjson wheels are unavailable
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# orjson.loads also accepts memoryview (e.g. over an mmap); the fallbacks do not
+ORJSON_AVAILABLE = orjson is not None
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson:
+        return orjson.loads(data)
+    if ujson:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON bytes (e.g. for a request body)."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def json_dumps_indented(data: Any) -> bytes:
+    """Serialize data as 2-space indented UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(path, data: Any) -> None:
+    """Write data to path as 2-space indented UTF-8 JSON."""
+    with open(path, 'wb') as f:
+        f.write(json_dumps_indented(data))
@@ -0,0 +1,51 @@
+"""
+Queue-based logging for the API server.
+
+api.py runs CalendarTool on an event loop; handing records to a background
+QueueListener keeps handler I/O (console, files) off that loop.
+"""
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+# Listener draining the root logger's queue, and the handlers it replaced
+_LISTENER: Optional[QueueListener] = None
+_ORIGINAL_HANDLERS: List[logging.Handler] = []
+
+
+def configure_async_logging() -> None:
+    """
+    Move the root logger's handlers behind a QueueListener thread.
+
+    Call once logging is configured (e.g. from the app's startup hook) and
+    pair with stop_async_logging() on shutdown. Logging calls then only
+    enqueue the record; the configured handlers run on the listener thread.
+    Set ASYNC_LOGGING=0 to keep handlers synchronous (e.g. when debugging).
+    """
+    global _LISTENER, _ORIGINAL_HANDLERS
+    if _LISTENER is not None or os.getenv("ASYNC_LOGGING", "1") == "0":
+        return
+
+    root = logging.getLogger()
+    _ORIGINAL_HANDLERS = list(root.handlers)
+    log_queue = queue.SimpleQueue()
+    _LISTENER = QueueListener(log_queue, *_ORIGINAL_HANDLERS, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    _LISTENER.start()
+    # Safety net if the shutdown hook never runs
+    atexit.register(stop_async_logging)
+
+
+def stop_async_logging() -> None:
+    """Drain the queue, stop the listener thread and restore the original root handlers."""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+
+    listener, _LISTENER = _LISTENER, None
+    logging.getLogger().handlers = _ORIGINAL_HANDLERS
+    listener.stop()
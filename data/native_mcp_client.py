@@ -8,9 +8,11 @@ import asyncio
 import json
 import logging
 import os
+import sys
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import subprocess
+import tempfile
 from dataclasses import dataclass
 
 import httpx
@@ -20,6 +22,10 @@ from data.mcp_file_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Interned env keys shared by every Klaviyo MCP server config
+_PRIVATE_API_KEY = sys.intern("PRIVATE_API_KEY")
+_READ_ONLY = sys.intern("READ_ONLY")
+
 
 @dataclass
 class MCPServerConfig:
@@ -33,25 +39,40 @@ class MCPServerConfig:
 class MCPServerProcess:
     """Manages a single MCP server child process"""
 
-    def __init__(self, config: MCPServerConfig):
+    # Pre-serialized JSON-RPC envelopes; only the id, tool name and arguments vary
+    _CALL_TOOL_PREFIX = '{"jsonrpc":"2.0","method":"tools/call","id":'
+    _LIST_TOOLS_PREFIX = '{"jsonrpc":"2.0","method":"tools/list","params":{},"id":'
+
+    def __init__(self, config: MCPServerConfig, base_env: Optional[Dict[str, str]] = None):
         self.config = config
+        self.base_env = base_env if base_env is not None else os.environ
         self.process: Optional[subprocess.Popen] = None
+        self._stderr_log = None
         self.request_id = 0
         self._lock = asyncio.Lock()
 
     async def start(self):
         """Start the MCP server process"""
         try:
-            # Merge environment variables
-            env = os.environ.copy()
-            env.update(self.config.env)
+            # Merge environment variables (shared base template + per-server overrides)
+            env = {**self.base_env, **self.config.env}
+
+            # Never pipe stderr: nothing drains it, so a chatty server would fill
+            # the pipe buffer and block. Keep it in a log file only when debugging.
+            stderr = subprocess.DEVNULL
+            if logger.isEnabledFor(logging.DEBUG):
+                safe_name = "".join(c if c.isalnum() else "-" for c in self.config.name)
+                log_path = os.path.join(tempfile.gettempdir(), f"mcp-{safe_name}.log")
+                self._stderr_log = open(log_path, "ab")
+                stderr = self._stderr_log
+                logger.debug(f"MCP server {self.config.name} stderr -> {log_path}")
 
             # Spawn the process
             self.process = subprocess.Popen(
                 [self.config.command] + self.config.args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=stderr,
                 env=env,
                 text=True,
                 bufsize=1
@@ -101,13 +122,16 @@ class MCPServerProcess:
 
     async def _send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Send a JSON-RPC request and wait for response"""
+        return await self._send_line(json.dumps(request) + "\n")
+
+    async def _send_line(self, request_str: str) -> Dict[str, Any]:
+        """Send a serialized JSON-RPC request line and wait for response"""
         async with self._lock:
             if not self.process or not self.process.stdin or not self.process.stdout:
                 raise RuntimeError(f"MCP server {self.config.name} not running")
 
             try:
                 # Send request
-                request_str = json.dumps(request) + "\n"
                 self.process.stdin.write(request_str)
                 self.process.stdin.flush()
 
@@ -132,17 +156,12 @@ class MCPServerProcess:
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call an MCP tool"""
         try:
-            request = {
-                "jsonrpc": "2.0",
-                "id": self._next_request_id(),
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+            request_str = (
+                f"{self._CALL_TOOL_PREFIX}{self._next_request_id()},"
+                f'"params":{{"name":{json.dumps(tool_name)},"arguments":{json.dumps(arguments)}}}}}\n'
+            )
 
-            response = await self._send_request(request)
+            response = await self._send_line(request_str)
             return response.get("result", {}).get("content", [])
 
         except Exception as e:
@@ -152,14 +171,9 @@ class MCPServerProcess:
     async def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools"""
         try:
-            request = {
-                "jsonrpc": "2.0",
-                "id": self._next_request_id(),
-                "method": "tools/list",
-                "params": {}
-            }
+            request_str = f"{self._LIST_TOOLS_PREFIX}{self._next_request_id()}}}\n"
 
-            response = await self._send_request(request)
+            response = await self._send_line(request_str)
             return response.get("result", {}).get("tools", [])
 
         except Exception as e:
@@ -179,6 +193,10 @@ class MCPServerProcess:
             except Exception as e:
                 logger.error(f"Error stopping MCP server {self.config.name}: {e}")
 
+        if self._stderr_log:
+            self._stderr_log.close()
+            self._stderr_log = None
+
 
 class NativeMCPClient:
     """
@@ -207,6 +225,8 @@ class NativeMCPClient:
         self.servers: Dict[str, MCPServerProcess] = {}
         self.clients_data: Dict[str, Any] = {}
         self._initialized = False
+        # Snapshot of the parent environment, shared by every server spawn
+        self._base_env: Dict[str, str] = {**os.environ}
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -229,7 +249,7 @@ class NativeMCPClient:
             # Start all MCP servers
             start_tasks = []
             for config in configs:
-                server = MCPServerProcess(config)
+                server = MCPServerProcess(config, base_env=self._base_env)
                 self.servers[config.name] = server
                 start_tasks.append(server.start())
 
@@ -320,8 +340,8 @@ class NativeMCPClient:
                         command="/usr/local/bin/uvx",  # Container path for uvx
                         args=["klaviyo-mcp-server@latest"],
                         env={
-                            "PRIVATE_API_KEY": api_key,
-                            "READ_ONLY": "true"
+                            _PRIVATE_API_KEY: api_key,
+                            _READ_ONLY: "true"
                         }
                     )
                     configs.append(config)
@@ -359,7 +379,7 @@ class NativeMCPClient:
                 if "Klaviyo" not in name:
                     continue
 
-                env = server_config.get("env", {}).copy()
+                env = {sys.intern(k): v for k, v in server_config.get("env", {}).items()}
 
                 config = MCPServerConfig(
                     name=name,
@@ -498,34 +518,33 @@ class NativeMCPClient:
 
         logger.info(f"Fetching all MCP data for {client_name}")
 
-        # Fetch data in parallel
-        segments_task = self._fetch_segments(server)
-        campaigns_task = self._fetch_campaigns(server, start_date, end_date)
-        flows_task = self._fetch_flows(server)
-        metrics_task = self._fetch_metrics(server)
-        lists_task = self._fetch_lists(server)
-        catalog_task = self._fetch_catalog_items(server)
-
-        segments, campaigns, flows, metrics, lists_data, catalog_items = await asyncio.gather(
-            segments_task,
-            campaigns_task,
-            flows_task,
-            metrics_task,
-            lists_task,
-            catalog_task,
-            return_exceptions=True
-        )
+        # Fetch data in parallel, failing fast as soon as a critical call raises
+        tasks = {
+            "segments": asyncio.create_task(self._fetch_segments(server)),
+            "campaigns": asyncio.create_task(self._fetch_campaigns(server, start_date, end_date)),
+            "flows": asyncio.create_task(self._fetch_flows(server)),
+            "metrics": asyncio.create_task(self._fetch_metrics(server)),
+            "lists": asyncio.create_task(self._fetch_lists(server)),
+            "catalog_items": asyncio.create_task(self._fetch_catalog_items(server)),
+        }
+        critical_tasks = {tasks["segments"]: "Segments", tasks["campaigns"]: "Campaigns"}
 
         # Fail immediately if any critical API call failed
         critical_errors = []
+        pending = set(tasks.values())
 
-        if isinstance(segments, Exception):
-            critical_errors.append(f"Segments API failed: {str(segments)}")
-
-        if isinstance(campaigns, Exception):
-            critical_errors.append(f"Campaigns API failed: {str(campaigns)}")
+        while pending and not critical_errors:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task in critical_tasks and task.exception() is not None:
+                    critical_errors.append(f"{critical_tasks[task]} API failed: {str(task.exception())}")
 
         if critical_errors:
+            # Cancel sibling calls that have not yet reached the server
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
             error_msg = f"\n❌ Critical MCP API Failures for {client_name}\n\n"
             for error in critical_errors:
                 error_msg += f"  • {error}\n"
@@ -533,6 +552,10 @@ class NativeMCPClient:
 
             raise RuntimeError(error_msg)
 
+        segments, campaigns, flows, metrics, lists_data, catalog_items = (
+            task.exception() or task.result() for task in tasks.values()
+        )
+
         # Non-critical failures can be warnings
         if isinstance(flows, Exception):
             logger.warning(f"Flows API failed (non-critical): {str(flows)}")
@@ -6,13 +6,54 @@ and design guidelines stored in the RAG system.
 """
 
 import os
-import json
-from typing import Dict, List, Optional, Any
+import functools
+import mmap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
+from common_json import ORJSON_AVAILABLE, json_loads, json_dumps_indented
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of parsed documents kept in the per-client document cache
+DOCUMENT_CACHE_SIZE = 10_000
+
+# JSON documents larger than this are parsed straight from an mmap view
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Plain-text documents fetched by get_all_data, keyed by result field
+TEXT_DOCUMENTS = {
+    "brand_voice": "brand_voice.txt",
+    "content_pillars": "content_pillars.txt",
+    "design_guidelines": "design_guidelines.txt",
+    "previous_campaigns": "previous_campaigns.txt",
+    "target_audience": "target_audience.txt",
+    "seasonal_themes": "seasonal_themes.txt",
+}
+
+# Prompt sections emitted by format_for_prompt, in order
+SECTION_HEADERS = (
+    ("brand_voice", "## Brand Voice\n\n"),
+    ("content_pillars", "## Content Pillars\n\n"),
+    ("product_catalog", "## Product Catalog\n\n"),
+    ("design_guidelines", "## Design Guidelines\n\n"),
+    ("target_audience", "## Target Audience\n\n"),
+    ("previous_campaigns", "## Previous Successful Campaigns\n\n"),
+    ("seasonal_themes", "## Seasonal Themes\n\n"),
+)
+
+SECTION_SEPARATOR = "\n\n---\n\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _client_dir(base_path: Path, client_name: str) -> Path:
+    """Map a client slug to its RAG directory (e.g. "rogue-creamery" -> base/rogue_creamery)."""
+    return base_path / client_name.replace("-", "_")
+
 
 class RAGClient:
     """
@@ -32,6 +73,16 @@ class RAGClient:
         """
         self.base_path = Path(rag_base_path)
 
+        # Reused across get_all_data calls to read documents concurrently
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rag-read")
+
+        # Document contents keyed by (path, mtime_ns); unchanged files are served from memory
+        self._cache: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Formatted prompt per client, stored with the document signature it was built from
+        self._prompt_cache: Dict[str, Tuple[FrozenSet[Tuple[str, int]], str]] = {}
+
         if not self.base_path.exists():
             logger.warning(f"RAG base path does not exist: {self.base_path}")
 
@@ -46,8 +97,23 @@ class RAGClient:
             Path to client's RAG directory
         """
         # Convert client slug to directory name (e.g., "rogue-creamery" -> "rogue_creamery")
-        dir_name = client_name.replace("-", "_")
-        return self.base_path / dir_name
+        return _client_dir(self.base_path, client_name)
+
+    def _cache_get(self, key: Tuple[str, int]) -> Any:
+        """Return a cached document for (path, mtime_ns), or None on miss."""
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: Tuple[str, int], value: Any) -> None:
+        """Store a document in the cache, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if len(self._cache) > DOCUMENT_CACHE_SIZE:
+                self._cache.popitem(last=False)
 
     def _read_file(self, file_path: Path) -> Optional[str]:
         """
@@ -60,15 +126,23 @@ class RAGClient:
             File contents as string, or None if file doesn't exist
         """
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                logger.info(f"Read RAG file: {file_path}")
-                return content
-            else:
+            try:
+                f = open(file_path, 'r', encoding='utf-8')
+            except FileNotFoundError:
                 logger.warning(f"RAG file not found: {file_path}")
                 return None
 
+            with f:
+                key = (str(file_path), os.fstat(f.fileno()).st_mtime_ns)
+                content = self._cache_get(key)
+                if content is not None:
+                    return content
+                content = f.read()
+
+            self._cache_put(key, content)
+            logger.info(f"Read RAG file: {file_path}")
+            return content
+
         except Exception as e:
             logger.error(f"Error reading RAG file {file_path}: {str(e)}")
             return None
@@ -84,15 +158,31 @@ class RAGClient:
             Parsed JSON data, or None if file doesn't exist
         """
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                logger.info(f"Read RAG JSON file: {file_path}")
-                return data
-            else:
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
                 logger.warning(f"RAG JSON file not found: {file_path}")
                 return None
 
+            with f:
+                st = os.fstat(f.fileno())
+                key = (str(file_path), st.st_mtime_ns)
+                data = self._cache_get(key)
+                if data is not None:
+                    return data
+
+                if ORJSON_AVAILABLE and st.st_size > MMAP_THRESHOLD_BYTES:
+                    # Large catalogs: let orjson parse the mapped pages without a read() copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            data = json_loads(view)
+                else:
+                    data = json_loads(f.read())
+
+            self._cache_put(key, data)
+            logger.info(f"Read RAG JSON file: {file_path}")
+            return data
+
         except Exception as e:
             logger.error(f"Error reading RAG JSON file {file_path}: {str(e)}")
             return None
@@ -227,19 +317,74 @@ class RAGClient:
         """
         client_path = self._get_client_path(client_name)
 
-        if not client_path.exists():
-            logger.warning(f"Client RAG directory not found: {client_path}")
-            return []
-
         try:
-            files = [f.name for f in client_path.iterdir() if f.is_file()]
+            with os.scandir(client_path) as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
             logger.info(f"Found {len(files)} RAG documents for {client_name}")
             return files
 
+        except FileNotFoundError:
+            logger.warning(f"Client RAG directory not found: {client_path}")
+            return []
+
         except Exception as e:
             logger.error(f"Error listing RAG documents: {str(e)}")
             return []
 
+    def _scan_client(self, client_name: str) -> Dict[str, os.DirEntry]:
+        """
+        List the files in a client's RAG directory with a single readdir.
+
+        Args:
+            client_name: Client slug
+
+        Returns:
+            Mapping of filename to DirEntry; empty if the directory is missing
+        """
+        try:
+            with os.scandir(self._get_client_path(client_name)) as entries:
+                return {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            logger.warning(f"Client RAG directory not found: {self._get_client_path(client_name)}")
+            return {}
+
+    def _document_signature(self, client_name: str) -> FrozenSet[Tuple[str, int]]:
+        """
+        Build a (filename, mtime_ns) signature of a client's RAG directory.
+
+        Args:
+            client_name: Client slug
+
+        Returns:
+            Frozen set of (filename, mtime_ns) pairs; empty if the directory is missing
+        """
+        return frozenset(
+            (name, entry.stat().st_mtime_ns)
+            for name, entry in self._scan_client(client_name).items()
+        )
+
+    def _read_product_catalog(self, entries: Dict[str, os.DirEntry]) -> Optional[Dict]:
+        """
+        Read the product catalog from scanned directory entries.
+
+        Args:
+            entries: Result of _scan_client
+
+        Returns:
+            Product catalog data (JSON), or None if not found
+        """
+        if "products.json" in entries:
+            data = self._read_json_file(Path(entries["products.json"].path))
+            if data:
+                return data
+
+        if "products.txt" in entries:
+            text = self._read_file(Path(entries["products.txt"].path))
+            if text:
+                return {"products": text}
+
+        return None
+
     def get_all_data(self, client_name: str) -> Dict[str, Any]:
         """
         Get all available RAG data for a client.
@@ -268,18 +413,32 @@ class RAGClient:
         """
         logger.info(f"Fetching all RAG data for {client_name}")
 
+        # One readdir tells us which documents exist; only those are opened,
+        # concurrently since the reads are small and I/O-bound
+        entries = self._scan_client(client_name)
+
+        futures = {
+            key: self._executor.submit(self._read_file, Path(entries[filename].path))
+            for key, filename in TEXT_DOCUMENTS.items()
+            if filename in entries
+        }
+        catalog_future = self._executor.submit(self._read_product_catalog, entries)
+
         result = {
-            "brand_voice": self.get_brand_voice(client_name),
-            "content_pillars": self.get_content_pillars(client_name),
-            "product_catalog": self.get_product_catalog(client_name),
-            "design_guidelines": self.get_design_guidelines(client_name),
-            "previous_campaigns": self.get_previous_campaigns(client_name),
-            "target_audience": self.get_target_audience(client_name),
-            "seasonal_themes": self.get_seasonal_themes(client_name),
-            "metadata": {
-                "client_name": client_name,
-                "available_documents": self.list_available_documents(client_name)
-            }
+            "brand_voice": None,
+            "content_pillars": None,
+            "product_catalog": catalog_future.result(),
+            "design_guidelines": None,
+            "previous_campaigns": None,
+            "target_audience": None,
+            "seasonal_themes": None,
+        }
+        for key, future in futures.items():
+            result[key] = future.result()
+
+        result["metadata"] = {
+            "client_name": client_name,
+            "available_documents": list(entries)
         }
 
         # Count how many documents were found
@@ -298,40 +457,34 @@ class RAGClient:
         Returns:
             Formatted text block with all RAG data
         """
-        data = self.get_all_data(client_name)
-
-        sections = []
-
-        if data["brand_voice"]:
-            sections.append(f"## Brand Voice\n\n{data['brand_voice']}")
+        signature = self._document_signature(client_name)
+        cached = self._prompt_cache.get(client_name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        if data["content_pillars"]:
-            sections.append(f"## Content Pillars\n\n{data['content_pillars']}")
-
-        if data["product_catalog"]:
-            if isinstance(data["product_catalog"], dict):
-                products_text = json.dumps(data["product_catalog"], indent=2)
-            else:
-                products_text = str(data["product_catalog"])
-            sections.append(f"## Product Catalog\n\n{products_text}")
-
-        if data["design_guidelines"]:
-            sections.append(f"## Design Guidelines\n\n{data['design_guidelines']}")
-
-        if data["target_audience"]:
-            sections.append(f"## Target Audience\n\n{data['target_audience']}")
-
-        if data["previous_campaigns"]:
-            sections.append(f"## Previous Successful Campaigns\n\n{data['previous_campaigns']}")
-
-        if data["seasonal_themes"]:
-            sections.append(f"## Seasonal Themes\n\n{data['seasonal_themes']}")
-
-        if not sections:
-            return f"# Brand Intelligence for {client_name}\n\nNo brand documents available."
-
-        formatted = f"# Brand Intelligence for {client_name}\n\n" + "\n\n---\n\n".join(sections)
+        data = self.get_all_data(client_name)
 
-        logger.info(f"Formatted RAG data for prompt: {len(formatted)} characters")
+        # Flat list of fragments joined once at the end
+        parts = [f"# Brand Intelligence for {client_name}\n\n"]
+
+        for key, header in SECTION_HEADERS:
+            content = data[key]
+            if not content:
+                continue
+            if key == "product_catalog" and isinstance(content, dict):
+                content = json_dumps_indented(content).decode('utf-8')
+            if len(parts) > 1:
+                parts.append(SECTION_SEPARATOR)
+            parts.append(header)
+            parts.append(content if isinstance(content, str) else str(content))
+
+        if len(parts) == 1:
+            parts.append("No brand documents available.")
+            formatted = "".join(parts)
+        else:
+            formatted = "".join(parts)
+            logger.info(f"Formatted RAG data for prompt: {len(formatted)} characters")
+
+        self._prompt_cache[client_name] = (signature, formatted)
 
         return formatted
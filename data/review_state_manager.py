@@ -5,20 +5,45 @@ Manages manual review checkpoints and workflow state in Firestore.
 Enables workflow split: Stage 1-2 → Review → Stage 3
 """
 
+import functools
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
 try:
+    from google.api_core.exceptions import NotFound
     from google.cloud import firestore
     FIRESTORE_AVAILABLE = True
 except ImportError:
     FIRESTORE_AVAILABLE = False
     firestore = None
 
+    class NotFound(Exception):
+        """Placeholder so except clauses stay valid without google-api-core."""
+
 logger = logging.getLogger(__name__)
 
+# Process-wide Firestore clients keyed by project ID, created on first use
+_firestore_clients: Dict[Optional[str], Any] = {}
+_firestore_clients_lock = threading.Lock()
+
+
+def _get_firestore_client(project_id: Optional[str] = None):
+    """Get or create the shared Firestore client for a project."""
+    client = _firestore_clients.get(project_id)
+    if client is None:
+        with _firestore_clients_lock:
+            client = _firestore_clients.get(project_id)
+            if client is None:
+                if project_id:
+                    client = firestore.Client(project=project_id)
+                else:
+                    client = firestore.Client()
+                _firestore_clients[project_id] = client
+    return client
+
 
 class ReviewStatus(Enum):
     """Review status states."""
@@ -38,6 +63,18 @@ class ReviewStateManager:
 
     COLLECTION_NAME = "workflow_reviews"
 
+    # Fields returned by the list_* methods; use get_review_state for the full document
+    SUMMARY_FIELDS = [
+        "workflow_id",
+        "client_name",
+        "start_date",
+        "end_date",
+        "review_status",
+        "submitted_at",
+        "reviewed_at",
+        "reviewed_by"
+    ]
+
     def __init__(self, project_id: Optional[str] = None):
         """
         Initialize review state manager.
@@ -45,20 +82,24 @@ class ReviewStateManager:
         Args:
             project_id: Google Cloud project ID (optional, uses default if not provided)
         """
+        self.project_id = project_id
+
         if not FIRESTORE_AVAILABLE:
             logger.warning("Firestore not available. Review state will not persist.")
-            self.db = None
-            return
+
+    @functools.cached_property
+    def db(self):
+        """Firestore client, created on first access (None if unavailable)."""
+        if not FIRESTORE_AVAILABLE:
+            return None
 
         try:
-            if project_id:
-                self.db = firestore.Client(project=project_id)
-            else:
-                self.db = firestore.Client()
+            db = _get_firestore_client(self.project_id)
             logger.info(f"ReviewStateManager initialized with Firestore")
+            return db
         except Exception as e:
             logger.error(f"Failed to initialize Firestore client: {e}")
-            self.db = None
+            return None
 
     def is_available(self) -> bool:
         """Check if Firestore is available."""
@@ -223,15 +264,13 @@ class ReviewStateManager:
 
         try:
             doc_ref = self.db.collection(self.COLLECTION_NAME).document(workflow_id)
+            now = datetime.utcnow().isoformat()
 
-            # Check if document exists first
-            doc = doc_ref.get()
-            if not doc.exists:
-                logger.warning(f"Cannot update data: Review state not found for {workflow_id}")
-                return False
-
+            # Dotted metadata paths let Firestore merge server-side, so no pre-read is needed
             update_data = {
-                "updated_at": datetime.utcnow().isoformat()
+                "updated_at": now,
+                "metadata.has_external_edits": True,
+                "metadata.last_external_edit_at": now
             }
 
             if detailed_calendar:
@@ -240,16 +279,15 @@ class ReviewStateManager:
             if simplified_calendar:
                 update_data["simplified_calendar"] = simplified_calendar
 
-            # Add metadata about the update
-            current_metadata = doc.to_dict().get("metadata", {})
-            current_metadata["has_external_edits"] = True
-            current_metadata["last_external_edit_at"] = datetime.utcnow().isoformat()
-            update_data["metadata"] = current_metadata
-
+            # update() fails with NotFound if the document does not exist
             doc_ref.update(update_data)
             logger.info(f"Updated review data for workflow: {workflow_id}")
             return True
 
+        except NotFound:
+            logger.warning(f"Cannot update data: Review state not found for {workflow_id}")
+            return False
+
         except Exception as e:
             logger.error(f"Failed to update review data: {e}", exc_info=True)
             return False
@@ -257,7 +295,8 @@ class ReviewStateManager:
     def list_pending_reviews(
         self,
         client_name: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         List workflows pending review.
@@ -265,6 +304,7 @@ class ReviewStateManager:
         Args:
             client_name: Filter by client (optional)
             limit: Maximum number of results
+            fields: Fields to return (defaults to SUMMARY_FIELDS)
 
         Returns:
             List of review state dictionaries
@@ -282,6 +322,7 @@ class ReviewStateManager:
                 query = query.where("client_name", "==", client_name)
 
             query = query.order_by("submitted_at", direction=firestore.Query.DESCENDING).limit(limit)
+            query = query.select(fields or self.SUMMARY_FIELDS)
 
             docs = query.stream()
             return [doc.to_dict() for doc in docs]
@@ -294,7 +335,8 @@ class ReviewStateManager:
         self,
         status: Optional[ReviewStatus] = None,
         client_name: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         List all reviews with optional filters.
@@ -303,6 +345,7 @@ class ReviewStateManager:
             status: Filter by review status (optional)
             client_name: Filter by client (optional)
             limit: Maximum number of results
+            fields: Fields to return (defaults to SUMMARY_FIELDS)
 
         Returns:
             List of review state dictionaries
@@ -321,6 +364,7 @@ class ReviewStateManager:
                 query = query.where("client_name", "==", client_name)
 
             query = query.order_by("submitted_at", direction=firestore.Query.DESCENDING).limit(limit)
+            query = query.select(fields or self.SUMMARY_FIELDS)
 
             docs = query.stream()
             return [doc.to_dict() for doc in docs]
@@ -371,16 +415,23 @@ class ReviewStateManager:
             cutoff_date = datetime.utcnow() - timedelta(days=days_old)
             cutoff_iso = cutoff_date.isoformat()
 
+            # Only document references are needed, so skip fetching the review payloads
             query = self.db.collection(self.COLLECTION_NAME).where(
                 "submitted_at", "<", cutoff_iso
-            )
+            ).select([])
 
             docs = query.stream()
             deleted_count = 0
 
-            for doc in docs:
-                doc.reference.delete()
-                deleted_count += 1
+            # BulkWriter pipelines the deletes instead of one blocking RPC per document
+            bulk_writer = self.db.bulk_writer()
+            try:
+                for doc in docs:
+                    bulk_writer.delete(doc.reference)
+                    deleted_count += 1
+            finally:
+                # Flushes queued deletes and stops the writer's background thread
+                bulk_writer.close()
 
             logger.info(f"Cleaned up {deleted_count} old review states")
             return deleted_count
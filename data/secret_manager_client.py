@@ -4,13 +4,45 @@ Google Secret Manager Client
 Fetches per-client Klaviyo API keys from Google Cloud Secret Manager.
 """
 
+import functools
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from google.cloud import secretmanager
 
 logger = logging.getLogger(__name__)
 
+# Process-wide Secret Manager client, created on first use and shared by all instances
+_service_client: Optional[secretmanager.SecretManagerServiceClient] = None
+_service_client_lock = threading.Lock()
+
+
+def _get_service_client() -> secretmanager.SecretManagerServiceClient:
+    """Get or create the shared Secret Manager service client."""
+    global _service_client
+    if _service_client is None:
+        with _service_client_lock:
+            if _service_client is None:
+                _service_client = secretmanager.SecretManagerServiceClient()
+    return _service_client
+
+
+# Special cases where the secret name differs from the client slug
+SECRET_NAME_MAPPING = {
+    "vlasic": "klaviyo-api-vlasic-labs",
+    "milagro": "klaviyo-api-milagro-mushrooms",
+    "chris-bean": "klaviyo-api-christopher-bean-coffee"
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _secret_name_for(client_name: str) -> str:
+    """Resolve a client slug to its Secret Manager secret name."""
+    # Default pattern: klaviyo-api-{client-slug}
+    return SECRET_NAME_MAPPING.get(client_name) or f"klaviyo-api-{client_name}"
+
 
 class SecretManagerClient:
     """
@@ -20,6 +52,11 @@ class SecretManagerClient:
     klaviyo-api-{client-slug}
     """
 
+    # API keys cached per process, keyed by (project_id, client_name, version) -> (api_key, fetched_at)
+    API_KEY_CACHE_TTL_SECONDS = 600
+    _key_cache: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+    _key_cache_lock = threading.Lock()
+
     def __init__(self, project_id: Optional[str] = None):
         """
         Initialize Secret Manager client.
@@ -34,9 +71,13 @@ class SecretManagerClient:
                 "Google Cloud project ID not found. Set GOOGLE_CLOUD_PROJECT environment variable."
             )
 
-        self.client = secretmanager.SecretManagerServiceClient()
         logger.info(f"SecretManagerClient initialized for project: {self.project_id}")
 
+    @functools.cached_property
+    def client(self) -> secretmanager.SecretManagerServiceClient:
+        """Secret Manager service client, created on first access."""
+        return _get_service_client()
+
     def _get_secret_name(self, client_name: str) -> str:
         """
         Convert client slug to Secret Manager secret name.
@@ -56,19 +97,7 @@ class SecretManagerClient:
         Returns:
             Secret name (e.g., "klaviyo-api-rogue-creamery")
         """
-        # Handle special cases where secret name differs from client slug
-        secret_name_mapping = {
-            "vlasic": "klaviyo-api-vlasic-labs",
-            "milagro": "klaviyo-api-milagro-mushrooms",
-            "chris-bean": "klaviyo-api-christopher-bean-coffee"
-        }
-
-        # Check if client has special mapping
-        if client_name in secret_name_mapping:
-            return secret_name_mapping[client_name]
-
-        # Default pattern: klaviyo-api-{client-slug}
-        return f"klaviyo-api-{client_name}"
+        return _secret_name_for(client_name)
 
     def get_api_key(self, client_name: str, version: str = "latest") -> str:
         """
@@ -84,6 +113,12 @@ class SecretManagerClient:
         Raises:
             Exception: If secret cannot be accessed
         """
+        cache_key = (self.project_id, client_name, version)
+        with self._key_cache_lock:
+            cached = self._key_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < self.API_KEY_CACHE_TTL_SECONDS:
+            return cached[0]
+
         secret_name = self._get_secret_name(client_name)
 
         # Build the secret version path
@@ -100,6 +135,9 @@ class SecretManagerClient:
 
             logger.info(f"Successfully fetched API key for {client_name}")
 
+            with self._key_cache_lock:
+                self._key_cache[cache_key] = (api_key, time.monotonic())
+
             return api_key
 
         except Exception as e:
@@ -108,6 +146,17 @@ class SecretManagerClient:
             )
             raise
 
+    def invalidate_api_key(self, client_name: str) -> None:
+        """
+        Drop cached API keys for a client (e.g. after key rotation).
+
+        Args:
+            client_name: Client slug (e.g., "rogue-creamery")
+        """
+        with self._key_cache_lock:
+            for cache_key in [k for k in self._key_cache if k[:2] == (self.project_id, client_name)]:
+                del self._key_cache[cache_key]
+
     def get_secret(self, secret_name: str, version: str = "latest") -> str:
         """
         Generic method to fetch any secret from Secret Manager.
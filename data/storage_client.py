@@ -5,7 +5,11 @@ Provides persistent storage for workflow outputs in Cloud Run production.
 Handles upload and retrieval of planning, calendar, and brief outputs.
 """
 
+import asyncio
 import logging
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
 from datetime import datetime
@@ -14,6 +18,39 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent downloads in get_outputs_bulk
+MAX_DOWNLOAD_WORKERS = 32
+
+# GCS JSON API batch requests accept at most 100 calls
+BATCH_SIZE = 100
+
+
+class _BatchSubmitted(Exception):
+    """Raised to leave a batch context after an explicit Batch.finish()."""
+
+
+# Process-wide storage clients keyed by project ID, shared across StorageClient instances
+_storage_clients: Dict[str, storage.Client] = {}
+_storage_clients_lock = threading.Lock()
+
+
+def _get_storage_client(project_id: str) -> storage.Client:
+    """Get or create the shared storage client for a project."""
+    client = _storage_clients.get(project_id)
+    if client is None:
+        with _storage_clients_lock:
+            client = _storage_clients.get(project_id)
+            if client is None:
+                client = storage.Client(project=project_id)
+                _storage_clients[project_id] = client
+    return client
+
+
+def _output_suffix(output_type: str) -> str:
+    """Filename suffix identifying an output type (e.g. "_planning.txt")."""
+    extension = ".txt" if output_type in ["planning", "briefs"] else ".json"
+    return f"_{output_type}{extension}"
+
 
 class StorageClient:
     """
@@ -23,6 +60,10 @@ class StorageClient:
     where local file storage is ephemeral.
     """
 
+    # Buckets already verified (or created) in this process
+    _ensured_buckets: set = set()
+    _ensure_lock = threading.Lock()
+
     def __init__(self, project_id: str, bucket_name: Optional[str] = None):
         """
         Initialize Storage Client.
@@ -31,11 +72,21 @@ class StorageClient:
             project_id: Google Cloud project ID
             bucket_name: GCS bucket name (defaults to {project_id}-emailpilot-outputs)
         """
-        self.client = storage.Client(project=project_id)
+        self.client = _get_storage_client(project_id)
         self.bucket_name = bucket_name or f"{project_id}-emailpilot-outputs"
-        self.bucket = self._get_or_create_bucket()
+        # Bucket handle only; existence is checked lazily on first write
+        self.bucket = self.client.bucket(self.bucket_name)
         logger.info(f"StorageClient initialized with bucket: {self.bucket_name}")
 
+    def _ensure_bucket(self) -> None:
+        """Make sure the bucket exists, checking at most once per process."""
+        if self.bucket_name in self._ensured_buckets:
+            return
+        with self._ensure_lock:
+            if self.bucket_name not in self._ensured_buckets:
+                self.bucket = self._get_or_create_bucket()
+                self._ensured_buckets.add(self.bucket_name)
+
     def _get_or_create_bucket(self) -> storage.Bucket:
         """Get existing bucket or create new one."""
         try:
@@ -68,6 +119,7 @@ class StorageClient:
             GCS URI (gs://bucket/filename)
         """
         try:
+            self._ensure_bucket()
             blob = self.bucket.blob(filename)
             blob.upload_from_string(content, content_type=content_type)
             logger.info(f"Saved output to GCS: gs://{self.bucket_name}/{filename}")
@@ -76,6 +128,25 @@ class StorageClient:
             logger.error(f"Failed to save output to GCS: {str(e)}")
             raise
 
+    async def save_output_async(
+        self,
+        filename: str,
+        content: str,
+        content_type: str = "text/plain"
+    ) -> str:
+        """
+        Save workflow output to GCS without blocking the event loop.
+
+        Args:
+            filename: Name for the blob
+            content: Content to save
+            content_type: MIME type (default: text/plain)
+
+        Returns:
+            GCS URI (gs://bucket/filename)
+        """
+        return await asyncio.to_thread(self.save_output, filename, content, content_type)
+
     def get_output(self, filename: str) -> Optional[str]:
         """
         Retrieve output from GCS.
@@ -98,6 +169,41 @@ class StorageClient:
             logger.error(f"Failed to retrieve output from GCS: {str(e)}")
             return None
 
+    def get_outputs_bulk(self, filenames: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve several outputs from GCS concurrently.
+
+        Args:
+            filenames: Blob names to download
+
+        Returns:
+            Dict mapping each filename to its content, or None if not found
+        """
+        def download(filename: str) -> Optional[str]:
+            try:
+                return self.bucket.blob(filename).download_as_text()
+            except NotFound:
+                logger.warning(f"Output not found in GCS: {filename}")
+                return None
+
+        results: Dict[str, Optional[str]] = {}
+        if not filenames:
+            return results
+
+        workers = min(MAX_DOWNLOAD_WORKERS, len(filenames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(download, name): name for name in filenames}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    results[filename] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to retrieve output {filename} from GCS: {str(e)}")
+                    results[filename] = None
+
+        logger.info(f"Retrieved {sum(1 for c in results.values() if c is not None)} outputs from GCS")
+        return results
+
     def get_latest_output(
         self,
         output_type: str,
@@ -117,23 +223,21 @@ class StorageClient:
             # Build prefix for filtering
             prefix = f"{client_name}_" if client_name else ""
 
-            # List blobs matching pattern
-            blobs = list(self.bucket.list_blobs(prefix=prefix))
-
             # Filter by output type
-            extension = ".txt" if output_type in ["planning", "briefs"] else ".json"
-            matching_blobs = [
-                b for b in blobs
-                if f"_{output_type}{extension}" in b.name
-            ]
+            suffix = _output_suffix(output_type)
 
-            if not matching_blobs:
+            # Stream the listing page by page, keeping only the most recent match
+            blobs = self.bucket.list_blobs(prefix=prefix, page_size=1000)
+            latest_blob = max(
+                (b for b in blobs if suffix in b.name),
+                key=operator.attrgetter("time_created"),
+                default=None
+            )
+
+            if latest_blob is None:
                 logger.info(f"No {output_type} outputs found in GCS")
                 return None
 
-            # Get most recent
-            latest_blob = max(matching_blobs, key=lambda b: b.time_created)
-
             content = latest_blob.download_as_text()
 
             return {
@@ -161,12 +265,12 @@ class StorageClient:
             List of output metadata dicts
         """
         try:
-            blobs = list(self.bucket.list_blobs(prefix=prefix))
+            blobs = self.bucket.list_blobs(prefix=prefix)
 
             # Filter by output type if specified
             if output_type:
-                extension = ".txt" if output_type in ["planning", "briefs"] else ".json"
-                blobs = [b for b in blobs if f"_{output_type}{extension}" in b.name]
+                suffix = _output_suffix(output_type)
+                blobs = (b for b in blobs if suffix in b.name)
 
             outputs = [
                 {
@@ -183,3 +287,51 @@ class StorageClient:
         except Exception as e:
             logger.error(f"Failed to list outputs: {str(e)}")
             return []
+
+    def delete_outputs(self, filenames: List[str]) -> int:
+        """
+        Delete outputs from GCS using batched requests.
+
+        Deletes are grouped into GCS batch requests of up to 100 calls each,
+        so cleanup costs one HTTP round-trip per 100 blobs. Blobs that are
+        already gone or fail to delete are logged and not counted.
+
+        Args:
+            filenames: Blob names to delete
+
+        Returns:
+            Number of outputs deleted
+        """
+        deleted_count = 0
+
+        for start in range(0, len(filenames), BATCH_SIZE):
+            chunk = filenames[start:start + BATCH_SIZE]
+            try:
+                with self.client.batch() as batch:
+                    for filename in chunk:
+                        self.bucket.delete_blob(filename)
+                    # Submit explicitly to get the per-request responses, without
+                    # raising on the first failure, so one missing blob does not
+                    # hide the deletes that went through
+                    responses = batch.finish(raise_exception=False)
+                    # Leave the block without Batch.__exit__ submitting it again
+                    raise _BatchSubmitted
+            except _BatchSubmitted:
+                pass
+            except Exception as e:
+                logger.error(f"Failed to delete batch of {len(chunk)} outputs from GCS: {str(e)}")
+                continue
+
+            # One sub-response per deferred delete, in request order
+            for filename, response in zip(chunk, responses):
+                if 200 <= response.status_code < 300:
+                    deleted_count += 1
+                elif response.status_code == 404:
+                    logger.warning(f"Output not found in GCS: {filename}")
+                else:
+                    logger.error(
+                        f"Failed to delete output {filename} from GCS: HTTP {response.status_code}"
+                    )
+
+        logger.info(f"Deleted {deleted_count} outputs from GCS")
+        return deleted_count
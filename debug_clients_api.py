@@ -1,5 +1,6 @@
 import httpx
 import logging
+import re
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,9 +35,10 @@ def check_clients_api(client_slug="chris-bean"):
         slug_parts = client_slug.lower().replace("-", " ").replace("_", " ").split()
         print(f"Slug parts: {slug_parts}")
         
+        # One lookahead per part: matches IDs containing every part, in any order
+        pattern = re.compile("".join(f"(?=.*{re.escape(part)})" for part in slug_parts), re.DOTALL)
         for client in clients:
-            client_id = client.get("id", "").lower()
-            if all(part in client_id for part in slug_parts):
+            if pattern.match(client.get("id", "").lower()):
                 print(f"✅ Partial match found: {client.get('id')}")
                 return client.get("id")
         
@@ -44,8 +46,7 @@ def check_clients_api(client_slug="chris-bean"):
         
         # List all available IDs for reference
         print("\nAvailable Client IDs:")
-        for client in clients:
-            print(f"- {client.get('id')}")
+        print("\n".join(f"- {client.get('id')}" for client in clients))
 
     except Exception as e:
         print(f"Exception: {e}")
@@ -1,9 +1,31 @@
 import httpx
 import asyncio
 import logging
+from typing import Optional
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Shared pooled client, reused across test_rag() calls
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+        )
+    return _CLIENT
+
+
+async def _close_client():
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
 async def test_rag():
     url = "https://emailpilot-orchestrator-935786836546.us-central1.run.app/api/rag/enhanced/retrieve"
     payload = {
@@ -15,14 +37,20 @@ async def test_rag():
     
     print(f"Testing POST to {url}")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(url, json=payload)
-            print(f"Status: {response.status_code}")
-            print(f"Response: {response.text}")
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Error: {e}")
+    try:
+        response = await _get_client().post(url, json=payload)
+        print(f"Status: {response.status_code}")
+        print(f"Response: {response.text}")
+        response.raise_for_status()
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+async def main():
+    try:
+        await test_rag()
+    finally:
+        await _close_client()
 
 if __name__ == "__main__":
-    asyncio.run(test_rag())
+    asyncio.run(main())
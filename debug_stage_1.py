@@ -1,7 +1,10 @@
 import asyncio
 import os
+import re
 import sys
 import logging
+from collections import Counter
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Add project root to path
@@ -13,6 +16,9 @@ from agents.calendar_agent import CalendarAgent
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SMS markers counted in the Stage 1 output, matched in a single pass
+SMS_MARKERS = re.compile(r'"campaign_type": "sms"|"channel": "sms"|"sms_variant"')
+
 async def run_test():
     load_dotenv()
     
@@ -64,9 +70,10 @@ async def run_test():
         print("="*50)
         
         # Analyze SMS counts
-        sms_type_count = planning_output.lower().count('"campaign_type": "sms"')
-        sms_channel_count = planning_output.lower().count('"channel": "sms"')
-        sms_variant_count = planning_output.lower().count('"sms_variant"')
+        marker_counts = Counter(SMS_MARKERS.findall(planning_output.lower()))
+        sms_type_count = marker_counts['"campaign_type": "sms"']
+        sms_channel_count = marker_counts['"channel": "sms"']
+        sms_variant_count = marker_counts['"sms_variant"']
         
         print(f"campaign_type: 'sms' count: {sms_type_count}")
         print(f"channel: 'sms' count: {sms_channel_count}")
@@ -77,9 +84,17 @@ async def run_test():
         else:
             print(f"\n❌ FAILURE: Stage 1 generated only {sms_type_count} SMS campaigns (required: 3)")
             
-        # Save output for Stage 2 testing
-        with open("debug_planning_output.txt", "w") as f:
-            f.write(planning_output)
+        # Save output for Stage 2 testing in a worker thread; with --chain,
+        # Stage 2 runs on the in-memory output while the file is written
+        save_task = asyncio.create_task(
+            asyncio.to_thread(Path("debug_planning_output.txt").write_text, planning_output)
+        )
+
+        if "--chain" in sys.argv:
+            from debug_stage_2 import run_stage_2
+            await run_stage_2(agent, planning_output)
+
+        await save_task
         print("\nSaved planning output to debug_planning_output.txt")
         
     except Exception as e:
@@ -2,18 +2,53 @@ import asyncio
 import os
 import sys
 import logging
-import json
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from agents.calendar_agent import CalendarAgent
+from common_json import json_loads
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+async def run_stage_2(agent: CalendarAgent, planning_output: str):
+    """Run Stage 2 on a planning output and print the SMS analysis."""
+    # Run Stage 2
+    calendar_json = await agent.stage_2_structuring(
+        client_name="chris-bean",
+        start_date="2026-01-01",
+        end_date="2026-01-31",
+        workflow_id="test_stage_2_recovery",
+        planning_output=planning_output
+    )
+    
+    print("\n" + "="*50)
+    print("STAGE 2 OUTPUT ANALYSIS")
+    print("="*50)
+    
+    # Accept a serialized calendar as well as a parsed one
+    if isinstance(calendar_json, (str, bytes)):
+        calendar_json = json_loads(calendar_json)
+
+    events = calendar_json.get('events', [])
+    print(f"Total events: {len(events)}")
+    
+    sms_events = [e for e in events if e.get('type') == 'sms' or e.get('channel') == 'sms']
+    print(f"SMS Events found: {len(sms_events)}")
+    
+    for i, event in enumerate(sms_events):
+        print(f"SMS Event {i+1}: {event.get('title', 'No Title')} (Type: {event.get('type')}, Channel: {event.get('channel')})")
+        
+    if len(sms_events) >= 3:
+        print("\n✅ SUCCESS: Stage 2 preserved required SMS campaigns!")
+    else:
+        print(f"\n❌ FAILURE: Stage 2 preserved only {len(sms_events)} SMS campaigns (required: 3)")
+
+
 async def run_test():
     load_dotenv()
     
@@ -56,33 +91,8 @@ async def run_test():
         agent = CalendarAgent(anthropic_api_key, mcp_client, rag_client, firestore_client, cache)
 
         
-        # Run Stage 2
-        calendar_json = await agent.stage_2_structuring(
-            client_name="chris-bean",
-            start_date="2026-01-01",
-            end_date="2026-01-31",
-            workflow_id="test_stage_2_recovery",
-            planning_output=planning_output
-        )
-        
-        print("\n" + "="*50)
-        print("STAGE 2 OUTPUT ANALYSIS")
-        print("="*50)
-        
-        events = calendar_json.get('events', [])
-        print(f"Total events: {len(events)}")
-        
-        sms_events = [e for e in events if e.get('type') == 'sms' or e.get('channel') == 'sms']
-        print(f"SMS Events found: {len(sms_events)}")
-        
-        for i, event in enumerate(sms_events):
-            print(f"SMS Event {i+1}: {event.get('title', 'No Title')} (Type: {event.get('type')}, Channel: {event.get('channel')})")
-            
-        if len(sms_events) >= 3:
-            print("\n✅ SUCCESS: Stage 2 preserved required SMS campaigns!")
-        else:
-            print(f"\n❌ FAILURE: Stage 2 preserved only {len(sms_events)} SMS campaigns (required: 3)")
-            
+        await run_stage_2(agent, planning_output)
+
     except Exception as e:
         logger.error(f"Test failed: {e}", exc_info=True)
 
@@ -11,12 +11,38 @@ import httpx
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from data.secret_manager_client import SecretManagerClient
 
+# Client whose Klaviyo key is used for discovery
+CLIENT_SLUG = "rogue-creamery"
+
+# Shared pooled client, reused across discover_tools() calls
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+        )
+    return _CLIENT
+
+
+async def _close_client():
+    """Close the shared HTTP client."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 
 async def discover_tools():
     """Query the MCP server to discover available tools."""
@@ -29,7 +55,8 @@ async def discover_tools():
     print("\n1. Fetching Klaviyo API key from Secret Manager...")
     try:
         secret_manager = SecretManagerClient()
-        api_key = secret_manager.get_api_key("rogue-creamery")
+        # Served from the per-process key cache after the first fetch
+        api_key = secret_manager.get_api_key(CLIENT_SLUG)
         print(f"   ✅ API key retrieved: {api_key[:10]}...{api_key[-10:]}")
     except Exception as e:
         print(f"   ❌ Failed to get API key: {e}")
@@ -48,55 +75,65 @@ async def discover_tools():
     # Make authenticated request to discovery endpoint
     print("\n3. Querying /mcp/tools endpoint...")
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        try:
-            response = await client.get(
-                "http://localhost:3334/mcp/tools",
-                headers={
-                    "X-Klaviyo-API-Key": api_key,
-                    "Authorization": f"Bearer {auth_token}"
-                }
-            )
-
-            print(f"   Status Code: {response.status_code}")
-
-            if response.status_code == 200:
-                print("   ✅ Request successful!")
-
-                # Parse and display tools
-                data = response.json()
-                print("\n4. Available MCP Tools:")
-                print("=" * 80)
-
-                if isinstance(data, dict):
-                    tools = data.get("tools", [])
-                    if tools:
-                        print(f"\nFound {len(tools)} tools:\n")
-                        for i, tool in enumerate(tools, 1):
-                            if isinstance(tool, dict):
-                                name = tool.get("name", "Unknown")
-                                description = tool.get("description", "No description")
-                                print(f"{i}. {name}")
-                                print(f"   {description}\n")
-                            else:
-                                print(f"{i}. {tool}\n")
-                    else:
-                        print("\nNo tools found in response")
-                        print(f"\nRaw response: {data}")
+    try:
+        response = await _get_client().get(
+            "http://localhost:3334/mcp/tools",
+            headers={
+                "X-Klaviyo-API-Key": api_key,
+                "Authorization": f"Bearer {auth_token}"
+            }
+        )
+
+        print(f"   Status Code: {response.status_code}")
+
+        if response.status_code == 200:
+            print("   ✅ Request successful!")
+
+            # Parse and display tools
+            data = response.json()
+            print("\n4. Available MCP Tools:")
+            print("=" * 80)
+
+            if isinstance(data, dict):
+                tools = data.get("tools", [])
+                if tools:
+                    print(f"\nFound {len(tools)} tools:\n")
+                    for i, tool in enumerate(tools, 1):
+                        if isinstance(tool, dict):
+                            name = tool.get("name", "Unknown")
+                            description = tool.get("description", "No description")
+                            print(f"{i}. {name}")
+                            print(f"   {description}\n")
+                        else:
+                            print(f"{i}. {tool}\n")
                 else:
+                    print("\nNo tools found in response")
                     print(f"\nRaw response: {data}")
-
             else:
-                print(f"   ❌ Request failed: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"\nRaw response: {data}")
+
+        else:
+            print(f"   ❌ Request failed: {response.status_code}")
+            print(f"   Response: {response.text}")
 
-        except httpx.HTTPError as e:
-            print(f"   ❌ HTTP error: {e}")
-        except Exception as e:
-            print(f"   ❌ Unexpected error: {e}")
+            # Key may have been rotated; drop the cached copy so the next run refetches it
+            if response.status_code == 401:
+                secret_manager.invalidate_api_key(CLIENT_SLUG)
+
+    except httpx.HTTPError as e:
+        print(f"   ❌ HTTP error: {e}")
+    except Exception as e:
+        print(f"   ❌ Unexpected error: {e}")
 
     print("\n" + "=" * 80)
 
 
+async def main():
+    try:
+        await discover_tools()
+    finally:
+        await _close_client()
+
+
 if __name__ == "__main__":
-    asyncio.run(discover_tools())
+    asyncio.run(main())
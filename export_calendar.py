@@ -3,9 +3,9 @@
 Export saved calendar to JSON file for manual import.
 """
 
+import asyncio
 import os
 import sys
-import json
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -15,8 +15,31 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from common_json import json_loads, write_json
 from data.review_state_manager import ReviewStateManager
 
+
+def _write_calendar(path: Path, stored, calendar) -> None:
+    """Write a stored calendar; JSON strings from Firestore are written verbatim."""
+    if isinstance(stored, str):
+        stored = stored.encode('utf-8')
+    if isinstance(stored, bytes):
+        with open(path, 'wb') as f:
+            f.write(stored)
+    else:
+        write_json(path, calendar)
+
+
+def _write_text(path: Path, text: str) -> None:
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+async def _run_writes(writes) -> None:
+    """Run (func, *args) file writes concurrently in worker threads."""
+    await asyncio.gather(*(asyncio.to_thread(func, *args) for func, *args in writes))
+
+
 def export_calendar():
     workflow_id = "chris-bean_2026-01-01_20251120_115012"
     
@@ -42,32 +65,41 @@ def export_calendar():
     detailed_calendar_str = review_data.get('detailed_calendar')
     planning_output = review_data.get('planning_output')
     
-    # Parse JSON strings
-    simplified_calendar = json.loads(simplified_calendar_str) if simplified_calendar_str else None
-    detailed_calendar = json.loads(detailed_calendar_str) if detailed_calendar_str else None
+    # Parse JSON strings (validates them and gives the counts below); stored
+    # strings are written back out as-is rather than re-serialized
+    def parse(stored):
+        return json_loads(stored) if isinstance(stored, (str, bytes)) else stored
+
+    simplified_calendar = parse(simplified_calendar_str) if simplified_calendar_str else None
+    detailed_calendar = parse(detailed_calendar_str) if detailed_calendar_str else None
     
     # Save to files
     output_dir = Path("./outputs")
     output_dir.mkdir(exist_ok=True)
     
+    simplified_file = output_dir / f"{workflow_id}_simplified_calendar.json"
+    detailed_file = output_dir / f"{workflow_id}_detailed_calendar.json"
+    planning_file = output_dir / f"{workflow_id}_planning.txt"
+
+    # Independent files, so write them concurrently
+    writes = []
+    if simplified_calendar:
+        writes.append((_write_calendar, simplified_file, simplified_calendar_str, simplified_calendar))
+    if detailed_calendar:
+        writes.append((_write_calendar, detailed_file, detailed_calendar_str, detailed_calendar))
+    if planning_output:
+        writes.append((_write_text, planning_file, planning_output))
+    asyncio.run(_run_writes(writes))
+
     if simplified_calendar:
-        simplified_file = output_dir / f"{workflow_id}_simplified_calendar.json"
-        with open(simplified_file, 'w') as f:
-            json.dump(simplified_calendar, f, indent=2)
         print(f"✅ Saved simplified calendar: {simplified_file}")
         print(f"   Events: {len(simplified_calendar.get('events', []))}")
     
     if detailed_calendar:
-        detailed_file = output_dir / f"{workflow_id}_detailed_calendar.json"
-        with open(detailed_file, 'w') as f:
-            json.dump(detailed_calendar, f, indent=2)
         print(f"✅ Saved detailed calendar: {detailed_file}")
         print(f"   Campaigns: {len(detailed_calendar.get('campaigns', []))}")
     
     if planning_output:
-        planning_file = output_dir / f"{workflow_id}_planning.txt"
-        with open(planning_file, 'w') as f:
-            f.write(planning_output)
         print(f"✅ Saved planning output: {planning_file}")
         print(f"   Length: {len(planning_output)} characters")
     
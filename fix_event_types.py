@@ -9,8 +9,14 @@ and updates them to valid types using the PUT /events/{event_id} endpoint.
 import json
 import sys
 import argparse
-import requests
-from typing import List, Dict, Any
+import asyncio
+import atexit
+import random
+import statistics
+import time
+import httpx
+from collections import Counter
+from typing import Iterable, Iterator, List, Dict, Any
 
 # Type mappings: invalid → valid
 TYPE_MAPPINGS = {
@@ -20,49 +26,164 @@ TYPE_MAPPINGS = {
     "email": "promotional"  # Best guess for generic emails
 }
 
+# Events requested per page from the calendar API
+EVENTS_PAGE_SIZE = 500
+
+# Upper bound on pages fetched, in case the API keeps reporting "has_more"
+MAX_EVENT_PAGES = 200
+
+# Maximum number of PUT requests in flight at once
+MAX_CONCURRENT_UPDATES = 50
+
+# Retry policy for PUT requests: exponential backoff with jitter on
+# transport errors and 5xx responses
+MAX_UPDATE_ATTEMPTS = 4
+RETRY_INITIAL_DELAY = 0.2  # seconds
+RETRY_MAX_DELAY = 5.0  # seconds
+
 # Valid event types per schema
 VALID_TYPES = [
     "promotional", "educational", "seasonal", "product_launch",
     "product_spotlight", "engagement", "win_back", "nurture",
     "resend", "lifecycle"
 ]
+VALID_SET = frozenset(VALID_TYPES)
+
+# Keep-alive client shared by all page fetches
+CLIENT = httpx.Client(
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=100)
+)
+atexit.register(CLIENT.close)
+
+def get_all_events(api_url: str, client_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield all events for a client from the API, one page at a time.
 
-def get_all_events(api_url: str, client_id: str) -> List[Dict[str, Any]]:
-    """Fetch all events for a client from the API."""
+    Pages are requested until the API stops reporting "has_more", returns an
+    empty page, or MAX_EVENT_PAGES is reached (guarding against an API that
+    ignores the paging params but keeps reporting "has_more").
+    """
     try:
-        response = requests.get(
-            f"{api_url}/events",
-            params={"client_id": client_id},
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("events", [])
-    except requests.exceptions.RequestException as e:
+        for page in range(1, MAX_EVENT_PAGES + 1):
+            response = CLIENT.get(
+                f"{api_url}/events",
+                params={"client_id": client_id, "page": page, "page_size": EVENTS_PAGE_SIZE}
+            )
+            response.raise_for_status()
+            data = response.json()
+            events = data.get("events", [])
+            yield from events
+
+            if not events or not data.get("has_more"):
+                break
+        else:
+            print(f"⚠️  Stopped after {MAX_EVENT_PAGES} pages; the API still reports more events")
+    except httpx.HTTPError as e:
         print(f"❌ Failed to fetch events: {e}")
-        if hasattr(e, 'response') and e.response is not None:
+        if isinstance(e, httpx.HTTPStatusError):
             print(f"Response status: {e.response.status_code}")
             print(f"Response body: {e.response.text}")
         sys.exit(1)
 
 
-def update_event_type(api_url: str, event_id: str, new_type: str) -> bool:
-    """Update an event's type using the PUT endpoint."""
-    try:
-        response = requests.put(
-            f"{api_url}/events/{event_id}",
-            json={"event_type": new_type},
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-        response.raise_for_status()
-        return True
-    except requests.exceptions.RequestException as e:
-        print(f"   ❌ Failed to update event {event_id}: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"   Response status: {e.response.status_code}")
-            print(f"   Response body: {e.response.text}")
+def scan_invalid_events(events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily yield a fix record for every event whose type is not in the schema."""
+    get_new_type = TYPE_MAPPINGS.get
+    for event in events:
+        event_type = event.get("event_type", "")
+        if event_type and event_type not in VALID_SET:
+            yield {
+                "id": event.get("id"),
+                "title": event.get("title", "Untitled"),
+                "current_type": event_type,
+                "new_type": get_new_type(event_type, "promotional")  # Default to promotional
+            }
+
+
+def _is_retryable(error: httpx.HTTPError) -> bool:
+    """Transport errors and server-side (5xx) failures are worth retrying; 4xx are not."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return True
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff for the given (1-based) attempt, plus up to 1s of jitter."""
+    delay = min(RETRY_INITIAL_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+    return min(delay + random.uniform(0, 1), RETRY_MAX_DELAY)
+
+
+async def update_event_type(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    api_url: str,
+    event_id: str,
+    new_type: str,
+    latencies: List[float]
+) -> bool:
+    """
+    Update an event's type using the PUT endpoint.
+
+    Retries transient failures up to MAX_UPDATE_ATTEMPTS times, and appends the
+    latency of every attempt (in seconds) to latencies. Backoff sleeps happen
+    outside the semaphore and are not counted as latency.
+    """
+    for attempt in range(1, MAX_UPDATE_ATTEMPTS + 1):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.put(
+                    f"{api_url}/events/{event_id}",
+                    json={"event_type": new_type},
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                error = None
+            except httpx.HTTPError as e:
+                error = e
+            latencies.append(time.perf_counter() - start)
+
+        if error is None:
+            return True
+        if attempt < MAX_UPDATE_ATTEMPTS and _is_retryable(error):
+            delay = _retry_delay(attempt)
+            print(f"   ⚠️  Attempt {attempt} for event {event_id} failed ({error}); "
+                  f"retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            continue
+        print(f"   ❌ Failed to update event {event_id}: {error}")
+        if isinstance(error, httpx.HTTPStatusError):
+            print(f"   Response status: {error.response.status_code}")
+            print(f"   Response body: {error.response.text}")
         return False
+    return False
+
+
+async def update_events(
+    api_url: str,
+    invalid_events: List[Dict[str, Any]],
+    latencies: List[float]
+) -> List[bool]:
+    """Update all events concurrently, bounded by MAX_CONCURRENT_UPDATES."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_UPDATES)
+    total = len(invalid_events)
+
+    async with httpx.AsyncClient(timeout=30, limits=limits) as client:
+        async def update(i: int, event: Dict[str, Any]) -> bool:
+            title = event["title"][:50]  # Truncate long titles
+            ok = await update_event_type(
+                client, semaphore, api_url, event["id"], event["new_type"], latencies
+            )
+            status = "✅ Success" if ok else "❌ Failed"
+            print(f"   [{i}/{total}] '{title}' ({event['id']}) "
+                  f"'{event['current_type']}' → '{event['new_type']}': {status}")
+            return ok
+
+        return await asyncio.gather(
+            *(update(i, event) for i, event in enumerate(invalid_events, 1))
+        )
 
 
 def main():
@@ -81,20 +202,19 @@ def main():
     client_id = "rogue-creamery"
 
     print(f"\n📂 Fetching events for client: {client_id}")
-    events = get_all_events(api_url, client_id)
-    print(f"✅ Fetched {len(events)} events")
 
-    # Identify invalid events
-    invalid_events = []
-    for event in events:
-        event_type = event.get("event_type", "")
-        if event_type and event_type not in VALID_TYPES:
-            invalid_events.append({
-                "id": event.get("id"),
-                "title": event.get("title", "Untitled"),
-                "current_type": event_type,
-                "new_type": TYPE_MAPPINGS.get(event_type, "promotional")  # Default to promotional
-            })
+    # Identify invalid events as each page arrives
+    event_count = 0
+
+    def counted(events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal event_count
+        for event in events:
+            event_count += 1
+            yield event
+
+    invalid_events = list(scan_invalid_events(counted(get_all_events(api_url, client_id))))
+
+    print(f"✅ Fetched {event_count} events")
 
     if not invalid_events:
         print("\n✅ No invalid event types found. All events are valid!")
@@ -104,12 +224,9 @@ def main():
     print(f"\n🔍 Found {len(invalid_events)} events with invalid types:")
 
     # Group by type for summary
-    type_counts = {}
-    for event in invalid_events:
-        current = event["current_type"]
-        type_counts[current] = type_counts.get(current, 0) + 1
+    type_counts = Counter(event["current_type"] for event in invalid_events)
 
-    for invalid_type, count in sorted(type_counts.items(), key=lambda x: -x[1]):
+    for invalid_type, count in type_counts.most_common():
         valid_type = TYPE_MAPPINGS.get(invalid_type, "promotional")
         print(f"   • '{invalid_type}' ({count} events) → '{valid_type}'")
 
@@ -126,24 +243,10 @@ def main():
 
     # Update events
     print("\n🔄 Updating events...")
-    success_count = 0
-    failed_count = 0
-
-    for i, event in enumerate(invalid_events, 1):
-        event_id = event["id"]
-        current_type = event["current_type"]
-        new_type = event["new_type"]
-        title = event["title"][:50]  # Truncate long titles
-
-        print(f"   [{i}/{len(invalid_events)}] Updating '{title}' ({event_id})")
-        print(f"       '{current_type}' → '{new_type}'")
-
-        if update_event_type(api_url, event_id, new_type):
-            success_count += 1
-            print(f"       ✅ Success")
-        else:
-            failed_count += 1
-            print(f"       ❌ Failed")
+    latencies: List[float] = []
+    results = asyncio.run(update_events(api_url, invalid_events, latencies))
+    success_count = sum(results)
+    failed_count = len(results) - success_count
 
     # Summary
     print("\n" + "=" * 80)
@@ -152,6 +255,11 @@ def main():
     print(f"✅ Successfully updated: {success_count} events")
     if failed_count > 0:
         print(f"❌ Failed to update: {failed_count} events")
+    if len(latencies) >= 2:
+        # quantiles() returns the 99 cut points between percentiles 1..99
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        print(f"⏱️  PUT latency over {len(latencies)} requests: "
+              f"p50={cuts[49] * 1000:.1f}ms p95={cuts[94] * 1000:.1f}ms p99={cuts[98] * 1000:.1f}ms")
     print("=" * 80)
 
     return 0 if failed_count == 0 else 1
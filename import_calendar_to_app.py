@@ -8,28 +8,55 @@ This script:
 3. POSTs to the /api/calendar/create-bulk-events endpoint
 """
 
-import json
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+from common_json import json_loads, json_dumps
+
+
+class _DefaultColorDict(dict):
+    """Color mapping whose lookups fall back to the "default" entry for unknown types."""
+
+    def __missing__(self, key):
+        return self["default"]
+
 
 # Color mapping for event types
-EVENT_TYPE_COLORS = {
+EVENT_TYPE_COLORS = _DefaultColorDict({
     "promotional": "bg-red-100 text-red-800",
     "engagement": "bg-blue-100 text-blue-800",
     "content": "bg-green-100 text-green-800",
     "special": "bg-purple-100 text-purple-800",
     "default": "bg-gray-200 text-gray-800"
-}
+})
+
+# Keep-alive session reused by every import_to_app() call. Retries cover
+# connection failures; the bulk create POST itself is not replayed on 5xx since
+# it is not idempotent (urllib3 only retries POST status codes when allowed).
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+
+def _load_json_file(path: str):
+    """Parse a JSON file with one whole-file binary read (no TextIOWrapper decode layer)."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
 
 
 def load_calendar_file(file_path: str) -> Dict:
     """Load the calendar JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return _load_json_file(file_path)
 
 
 def load_strategy_summary(calendar_file_path: str) -> Dict | None:
@@ -43,46 +70,53 @@ def load_strategy_summary(calendar_file_path: str) -> Dict | None:
     strategy_file_path = calendar_file_path.replace('_calendar_app.json', '_strategy_summary.json')
 
     try:
-        with open(strategy_file_path, 'r') as f:
-            return json.load(f)
+        return _load_json_file(strategy_file_path)
     except FileNotFoundError:
         print(f"⚠ Strategy summary not found: {strategy_file_path}")
         print("  (This is normal for workflows run before strategy_summary feature)")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # JSONDecodeError from json/orjson/ujson
         print(f"⚠ Error parsing strategy summary JSON: {e}")
         return None
 
 
 def transform_event(event: Dict, client_id: str) -> Dict:
     """Transform an event from emailpilot-simple format to emailpilot-app format."""
-    event_type = event.get('type', 'default')
+    get = event.get
+    event_type = get('type', 'default')
 
     return {
         "client_id": client_id,
-        "title": event.get('title', ''),
-        "content": event.get('description', ''),
-        "event_date": event.get('date'),
+        "title": get('title', ''),
+        "content": get('description', ''),
+        "event_date": get('date'),
         "event_type": event_type,
-        "send_time": event.get('send_time'),
-        "color": EVENT_TYPE_COLORS.get(event_type, EVENT_TYPE_COLORS['default']),
+        "send_time": get('send_time'),
+        "color": EVENT_TYPE_COLORS[event_type],
         # Optional fields
-        "segment": event.get('segment'),
-        "subject_a": event.get('subject_a'),
-        "subject_b": event.get('subject_b'),
-        "preview_text": event.get('preview_text'),
-        "main_cta": event.get('main_cta'),
-        "offer": event.get('offer'),
-        "ab_test": event.get('ab_test')
+        "segment": get('segment'),
+        "subject_a": get('subject_a'),
+        "subject_b": get('subject_b'),
+        "preview_text": get('preview_text'),
+        "main_cta": get('main_cta'),
+        "offer": get('offer'),
+        "ab_test": get('ab_test')
     }
 
 
-def create_bulk_request(calendar_data: Dict, strategy_summary: Dict | None = None) -> Dict:
+def create_bulk_request(
+    calendar_data: Dict,
+    strategy_summary: Dict | None = None,
+    in_place: bool = False
+) -> Dict:
     """Create the BulkEventsCreate request payload.
 
     Args:
         calendar_data: Calendar data from emailpilot-simple
         strategy_summary: Optional strategy summary from Claude Sonnet 4.5
+        in_place: Replace each source event in calendar_data['events'] with its
+            transformed version as it goes, so only one copy of every event is
+            alive at a time. Use when calendar_data is not needed afterwards.
 
     Returns:
         BulkEventsCreate payload for emailpilot-app API
@@ -90,10 +124,15 @@ def create_bulk_request(calendar_data: Dict, strategy_summary: Dict | None = Non
     client_id = calendar_data.get('client_id')
     events = calendar_data.get('events', [])
 
-    transformed_events = [
-        transform_event(event, client_id)
-        for event in events
-    ]
+    if in_place:
+        for i, event in enumerate(events):
+            events[i] = transform_event(event, client_id)
+        transformed_events = events
+    else:
+        transformed_events = [
+            transform_event(event, client_id)
+            for event in events
+        ]
 
     payload = {
         "client_id": client_id,
@@ -114,7 +153,12 @@ def import_to_app(api_url: str, bulk_request: Dict) -> Dict:
     print(f"Importing {len(bulk_request['events'])} events to {endpoint}...")
     print(f"Client: {bulk_request['client_id']}")
 
-    response = requests.post(endpoint, json=bulk_request)
+    response = _SESSION.post(
+        endpoint,
+        data=json_dumps(bulk_request),
+        headers={'Content-Type': 'application/json'},
+        timeout=(3.05, 30)
+    )
     response.raise_for_status()
 
     return response.json()
@@ -158,7 +202,8 @@ def main():
 
     # Transform to bulk request
     print("Transforming data...")
-    bulk_request = create_bulk_request(calendar_data, strategy_summary)
+    # calendar_data is not used again, so transform its events in place
+    bulk_request = create_bulk_request(calendar_data, strategy_summary, in_place=True)
     print(f"✓ Transformed {len(bulk_request['events'])} events")
     if strategy_summary:
         print(f"✓ Included Strategy Summary in payload")
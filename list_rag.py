@@ -3,10 +3,14 @@ from pathlib import Path
 
 rag_path = Path("/Users/Damon/klaviyo/klaviyo-audit-automation/emailpilot-orchestrator/rag/corpus")
 
-if rag_path.exists():
-    print(f"Listing contents of {rag_path}:")
-    for item in rag_path.iterdir():
-        if item.is_dir():
-            print(f"DIR: {item.name}")
-else:
+# One scandir pass; DirEntry.is_dir() uses the d_type from the listing and only
+# stats symlinks, which are followed like Path.is_dir()
+try:
+    with os.scandir(rag_path) as it:
+        dirs = [entry.name for entry in it if entry.is_dir()]
+except FileNotFoundError:
     print(f"Path does not exist: {rag_path}")
+else:
+    print(f"Listing contents of {rag_path}:")
+    for name in dirs:
+        print(f"DIR: {name}")
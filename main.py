@@ -15,6 +15,7 @@ import asyncio
 import logging
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -31,17 +32,46 @@ from data.mcp_cache import MCPCache
 from data.secret_manager_client import SecretManagerClient
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that calls strftime at most once per second for %(asctime)s.
+
+    Output is identical to logging.Formatter's default timestamp; only the
+    milliseconds are formatted per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second = None
+        self._cached_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
 # Configure logging
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(
+    _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_log_handler]
 )
 
 logger = logging.getLogger(__name__)
 
+# Console banners, joined once so each prints with a single write
+_BAR = "=" * 80
+_HEADER = "\n".join([_BAR, "EmailPilot Simple - Calendar Generation Workflow", _BAR])
+_RESULTS_HEADER = "\n".join(["", _BAR, "WORKFLOW RESULTS", _BAR])
+_FOOTER = "\n".join(["", _BAR, "Workflow execution complete", _BAR, ""])
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -125,10 +155,10 @@ def load_config():
     # Validate required environment variables
     missing = [key for key, value in config.items() if not value]
     if missing:
-        logger.error(f"Missing required environment variables: {', '.join(missing)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing))
         logger.error("Please set the following environment variables:")
         for key in missing:
-            logger.error(f"  - {key.upper()}")
+            logger.error("  - %s", key.upper())
         sys.exit(1)
 
     return config
@@ -171,7 +201,7 @@ def initialize_components(config: dict, args: argparse.Namespace):
     logger.info("Data layer clients initialized")
 
     # Initialize Calendar Agent
-    logger.info(f"Initializing CalendarAgent with model: {args.model}")
+    logger.info("Initializing CalendarAgent with model: %s", args.model)
 
     calendar_agent = CalendarAgent(
         anthropic_api_key=config['anthropic_api_key'],
@@ -221,10 +251,10 @@ async def run_full_workflow(
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    logger.info("="*80)
-    logger.info(f"Running full workflow for {client_name}")
-    logger.info(f"Date range: {start_date} to {end_date}")
-    logger.info("="*80)
+    logger.info(_BAR)
+    logger.info("Running full workflow for %s", client_name)
+    logger.info("Date range: %s to %s", start_date, end_date)
+    logger.info(_BAR)
 
     try:
         result = await calendar_tool.run_workflow(
@@ -235,9 +265,7 @@ async def run_full_workflow(
         )
 
         # Print results
-        print("\n" + "="*80)
-        print("WORKFLOW RESULTS")
-        print("="*80)
+        print(_RESULTS_HEADER)
 
         if result.get('success'):
             print("\n✅ Workflow completed successfully!")
@@ -281,7 +309,7 @@ async def run_full_workflow(
             return 1
 
     except Exception as e:
-        logger.error(f"Workflow failed with exception: {str(e)}", exc_info=True)
+        logger.error("Workflow failed with exception: %s", e, exc_info=True)
         print(f"\n❌ Workflow failed: {str(e)}")
         return 1
 
@@ -306,10 +334,10 @@ async def run_single_stage(
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    logger.info("="*80)
-    logger.info(f"Running Stage {stage} only for {client_name}")
-    logger.info(f"Date range: {start_date} to {end_date}")
-    logger.info("="*80)
+    logger.info(_BAR)
+    logger.info("Running Stage %s only for %s", stage, client_name)
+    logger.info("Date range: %s to %s", start_date, end_date)
+    logger.info(_BAR)
 
     try:
         # For stages 2 and 3, we need outputs from previous stages
@@ -334,9 +362,7 @@ async def run_single_stage(
         )
 
         # Print results
-        print("\n" + "="*80)
-        print(f"STAGE {stage} RESULTS")
-        print("="*80)
+        print(f"\n{_BAR}\nSTAGE {stage} RESULTS\n{_BAR}")
 
         if result.get('success'):
             print(f"\n✅ Stage {stage} completed successfully!")
@@ -358,7 +384,7 @@ async def run_single_stage(
             return 1
 
     except Exception as e:
-        logger.error(f"Stage {stage} failed with exception: {str(e)}", exc_info=True)
+        logger.error("Stage %s failed with exception: %s", stage, e, exc_info=True)
         print(f"\n❌ Stage {stage} failed: {str(e)}")
         return 1
 
@@ -367,37 +393,39 @@ async def main():
     """Main entry point."""
     args = parse_args()
 
-    print("="*80)
-    print("EmailPilot Simple - Calendar Generation Workflow")
-    print("="*80)
+    print(_HEADER)
 
     # Load configuration
     config = load_config()
 
-    # Initialize non-async clients
+    # Initialize non-async clients. They are independent, and the Google Cloud
+    # clients do blocking credential discovery, so build them concurrently
+    # in worker threads.
     logger.info("Initializing workflow components...")
     logger.info("Initializing data layer clients...")
 
-    secret_manager_client = SecretManagerClient(
-        project_id=config['google_cloud_project']
-    )
-
-    rag_client = RAGClient(
-        rag_base_path='/Users/Damon/klaviyo/klaviyo-audit-automation/emailpilot-orchestrator/rag'
-    )
-
-    firestore_client = FirestoreClient(
-        project_id=config['google_cloud_project']
+    secret_manager_client, rag_client, firestore_client, cache = await asyncio.gather(
+        asyncio.to_thread(
+            SecretManagerClient,
+            project_id=config['google_cloud_project']
+        ),
+        asyncio.to_thread(
+            RAGClient,
+            rag_base_path='/Users/Damon/klaviyo/klaviyo-audit-automation/emailpilot-orchestrator/rag'
+        ),
+        asyncio.to_thread(
+            FirestoreClient,
+            project_id=config['google_cloud_project']
+        ),
+        asyncio.to_thread(MCPCache)
     )
 
-    cache = MCPCache()
-
     # Use async context manager for MCPClient
     async with MCPClient(secret_manager_client=secret_manager_client) as mcp_client:
         logger.info("Data layer clients initialized")
 
         # Initialize Calendar Agent
-        logger.info(f"Initializing CalendarAgent with model: {args.model}")
+        logger.info("Initializing CalendarAgent with model: %s", args.model)
 
         calendar_agent = CalendarAgent(
             anthropic_api_key=config['anthropic_api_key'],
@@ -446,9 +474,7 @@ async def main():
                 save_outputs=save_outputs
             )
 
-    print("\n" + "="*80)
-    print("Workflow execution complete")
-    print("="*80 + "\n")
+    print(_FOOTER)
 
     sys.exit(exit_code)
 
@@ -6,7 +6,6 @@ Retrieves calendar from Firestore and pushes to localhost:8000
 
 import os
 import sys
-import json
 import httpx
 from pathlib import Path
 from dotenv import load_dotenv
@@ -17,8 +16,11 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from common_http import get_client, close_client
+from common_json import json_loads, json_dumps, json_dumps_indented
 from data.review_state_manager import ReviewStateManager
 
+
 async def push_calendar():
     workflow_id = "chris-bean_2026-01-01_20251120_115012"
     
@@ -53,8 +55,15 @@ async def push_calendar():
         print("❌ No simplified calendar found")
         return 1
     
-    # Parse JSON string
-    simplified_calendar = json.loads(simplified_calendar_str)
+    # Parse only to validate and count events; the stored JSON is posted as-is
+    if isinstance(simplified_calendar_str, (str, bytes)):
+        simplified_calendar = json_loads(simplified_calendar_str)
+        body = simplified_calendar_str
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+    else:
+        simplified_calendar = simplified_calendar_str
+        body = json_dumps(simplified_calendar)
     
     print(f"📅 Calendar has {len(simplified_calendar.get('events', []))} events")
     
@@ -63,28 +72,36 @@ async def push_calendar():
     
     print(f"Pushing to Calendar App: {calendar_app_url}")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                calendar_app_url,
-                json=simplified_calendar
-            )
-            response.raise_for_status()
-            
-            print(f"✅ Successfully pushed calendar to app!")
-            print(f"Response: {response.status_code}")
-            result = response.json()
-            print(f"Data: {json.dumps(result, indent=2)}")
-            
-            return 0
-            
-        except httpx.HTTPError as e:
-            print(f"❌ Failed to push calendar: {e}")
-            if hasattr(e, 'response') and e.response:
-                print(f"Status: {e.response.status_code}")
-                print(f"Response: {e.response.text}")
-            return 1
+    try:
+        response = await get_client().post(
+            calendar_app_url,
+            content=body,
+            headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
+        
+        print(f"✅ Successfully pushed calendar to app!")
+        print(f"Response: {response.status_code}")
+        result = response.json()
+        print(f"Data: {json_dumps_indented(result).decode()}")
+        
+        return 0
+        
+    except httpx.HTTPError as e:
+        print(f"❌ Failed to push calendar: {e}")
+        if hasattr(e, 'response') and e.response:
+            print(f"Status: {e.response.status_code}")
+            print(f"Response: {e.response.text}")
+        return 1
+
+
+async def main():
+    try:
+        return await push_calendar()
+    finally:
+        await close_client()
+
 
 if __name__ == "__main__":
     import asyncio
-    sys.exit(asyncio.run(push_calendar()))
+    sys.exit(asyncio.run(main()))
@@ -6,12 +6,14 @@ Reads calendar_import.json and pushes events to the emailpilot-app calendar API.
 Fixes validation errors during transformation.
 """
 
-import json
 import sys
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from common_json import json_loads, json_dumps
 
 
 # Type mappings: invalid → valid
@@ -19,17 +21,31 @@ TYPE_MAPPINGS = {
     "content": "educational",
     "special": "product_spotlight"
 }
+# Bound once so per-event type fixes skip the attribute lookup
+_TYPE_MAPPINGS_GET = TYPE_MAPPINGS.get
+
+# Keep-alive session shared by push_to_api() calls. Retries cover connection
+# failures; the bulk create POST is not replayed on 5xx since it is not
+# idempotent (urllib3 only retries POST status codes when allowed).
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 
 def load_calendar_data(file_path: str) -> Dict[str, Any]:
     """Load calendar data from JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return json_loads(f.read())
 
 
 def fix_event_type(event_type: str) -> str:
     """Fix invalid event types."""
-    return TYPE_MAPPINGS.get(event_type, event_type)
+    return _TYPE_MAPPINGS_GET(event_type, event_type)
 
 
 def transform_event(event: Dict[str, Any]) -> Dict[str, Any]:
@@ -47,34 +63,30 @@ def transform_event(event: Dict[str, Any]) -> Dict[str, Any]:
     - tags → metadata (add to metadata dict)
     - client_id → client_id
     """
-    # Fix event type if needed
-    event_type = fix_event_type(event.get("type", "campaign"))
-
-    # Prepare metadata
-    metadata = event.get("custom_fields", {}).copy() if event.get("custom_fields") else {}
-
-    # Add tags to metadata
-    if event.get("tags"):
-        metadata["tags"] = event["tags"]
-
-    # Add client_name to metadata
-    if event.get("client_name"):
-        metadata["client_name"] = event["client_name"]
+    get = event.get
+    event_type = get("type", "campaign")
+    tags = get("tags")
+    client_name = get("client_name")
+
+    # custom_fields, plus tags and client_name when present, merged in one pass
+    metadata = {
+        **(get("custom_fields") or {}),
+        **({"tags": tags} if tags else {}),
+        **({"client_name": client_name} if client_name else {})
+    }
 
-    # Transform to CalendarEventCreate schema
-    transformed = {
+    # Transform to CalendarEventCreate schema (fixing the event type if needed)
+    return {
         "client_id": event["client_id"],
         "title": event["name"],
         "event_date": event["date"],
-        "description": event.get("description", ""),
-        "event_type": event_type,
-        "status": event.get("status", "draft"),
-        "send_time": event.get("time"),
+        "description": get("description", ""),
+        "event_type": _TYPE_MAPPINGS_GET(event_type, event_type),
+        "status": get("status", "draft"),
+        "send_time": get("time"),
         "metadata": metadata
     }
 
-    return transformed
-
 
 def create_bulk_request(events: List[Dict[str, Any]], client_id: str) -> Dict[str, Any]:
     """Create BulkEventsCreate request payload."""
@@ -84,21 +96,27 @@ def create_bulk_request(events: List[Dict[str, Any]], client_id: str) -> Dict[st
     }
 
 
-def push_to_api(bulk_request: Dict[str, Any], api_url: str) -> Dict[str, Any]:
+def push_to_api(
+    bulk_request: Dict[str, Any],
+    api_url: str,
+    session: Optional[requests.Session] = None
+) -> Dict[str, Any]:
     """
     Push events to emailpilot-app API.
 
     Args:
         bulk_request: BulkEventsCreate payload
         api_url: API endpoint URL
+        session: Session to send the request on (default: shared keep-alive session)
 
     Returns:
         API response data
     """
+    session = session or _SESSION
     try:
-        response = requests.post(
+        response = session.post(
             api_url,
-            json=bulk_request,
+            data=json_dumps(bulk_request),
             headers={"Content-Type": "application/json"},
             timeout=30
         )
@@ -124,15 +142,14 @@ def main():
     calendar_file = "outputs/rogue-creamery_2026-01-01_2026-01-31_20251118_194816_calendar_import.json"
     api_url = "http://localhost:8000/api/calendar/create-bulk-events"
 
-    # Check if calendar file exists
-    if not Path(calendar_file).exists():
-        print(f"❌ Calendar file not found: {calendar_file}")
-        sys.exit(1)
-
     print(f"\n📂 Loading calendar data from: {calendar_file}")
 
-    # Load calendar data
-    calendar_data = load_calendar_data(calendar_file)
+    # Load calendar data (a missing file surfaces from open, no separate stat)
+    try:
+        calendar_data = load_calendar_data(calendar_file)
+    except FileNotFoundError:
+        print(f"❌ Calendar file not found: {calendar_file}")
+        sys.exit(1)
 
     events = calendar_data.get("events", [])
     client_id = calendar_data.get("metadata", {}).get("client_id", "rogue-creamery")
@@ -141,19 +158,14 @@ def main():
 
     # Transform events
     print("\n🔄 Transforming events...")
-    transformed_events = []
-    validation_fixes = []
-
-    for i, event in enumerate(events, 1):
-        original_type = event.get("type")
-        transformed = transform_event(event)
-        transformed_events.append(transformed)
-
-        # Track validation fixes
-        if original_type != transformed["event_type"]:
-            validation_fixes.append(
-                f"  Event {i}: '{event['name']}' - type '{original_type}' → '{transformed['event_type']}'"
-            )
+    transformed_events = [transform_event(event) for event in events]
+
+    # Track validation fixes (only events whose type changed produce a line)
+    validation_fixes = [
+        f"  Event {i}: '{event['name']}' - type '{event.get('type')}' → '{transformed['event_type']}'"
+        for i, (event, transformed) in enumerate(zip(events, transformed_events), 1)
+        if event.get("type") != transformed["event_type"]
+    ]
 
     print(f"✅ Transformed {len(transformed_events)} events")
 
@@ -6,7 +6,6 @@ Fetches from Firestore and regenerates simplified calendar with new fields.
 
 import os
 import sys
-import json
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,9 +15,11 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from common_json import json_loads, write_json
 from data.review_state_manager import ReviewStateManager
 from tools.format_adapter import CalendarFormatAdapter
 
+
 def reprocess_workflow():
     workflow_id = "chris-bean_2026-01-01_20251120_115012"
     
@@ -51,7 +52,7 @@ def reprocess_workflow():
         return 1
     
     # Parse JSON
-    detailed_calendar = json.loads(detailed_calendar_str)
+    detailed_calendar = json_loads(detailed_calendar_str)
     
     print(f"📅 Detailed calendar has {len(detailed_calendar.get('campaigns', []))} campaigns")
     
@@ -65,8 +66,7 @@ def reprocess_workflow():
     
     # Save enriched calendar
     output_file = Path("./outputs") / f"{workflow_id}_enriched_calendar.json"
-    with open(output_file, 'w') as f:
-        json.dump(enriched_calendar, f, indent=2)
+    write_json(output_file, enriched_calendar)
     
     print(f"✅ Saved enriched calendar: {output_file}")
     print(f"   Events: {len(enriched_calendar.get('events', []))}")
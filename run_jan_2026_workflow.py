@@ -3,6 +3,14 @@ import asyncio
 import json
 import sys
 
+# Status polling: give up after 5 minutes, backing off from 1s to 15s between polls
+POLL_TIMEOUT_SECONDS = 300
+POLL_INITIAL_DELAY = 1.0
+POLL_MAX_DELAY = 15.0
+
+# How long a long-poll capable server may hold each status request
+LONG_POLL_SECONDS = 30
+
 async def run_workflow():
     url = "http://localhost:9000/api/workflows/checkpoint"
     payload = {
@@ -14,7 +22,10 @@ async def run_workflow():
     
     print(f"Triggering workflow for {payload['clientName']} ({payload['startDate']} to {payload['endDate']})...")
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
+    # One pooled client for the POST and every status poll; keep idle connections
+    # alive longer than the longest poll interval so each poll reuses the same socket
+    limits = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0)
+    async with httpx.AsyncClient(timeout=300.0, limits=limits) as client:
         try:
             response = await client.post(url, json=payload)
             
@@ -30,9 +41,18 @@ async def run_workflow():
                 workflow_id = job_id
                 if workflow_id:
                     print(f"\nPolling status for workflow {workflow_id}...")
-                    for _ in range(60):  # Poll for up to 5 minutes
-                        status_url = f"http://localhost:9000/api/workflows/{workflow_id}"
-                        status_resp = await client.get(status_url)
+                    status_url = f"http://localhost:9000/api/workflows/{workflow_id}"
+                    # Ask the server to hold the request until the state changes;
+                    # servers that ignore the params simply answer immediately
+                    params = {"wait_for_state": "WAITING_FOR_REVIEW", "timeout": LONG_POLL_SECONDS}
+                    delay = POLL_INITIAL_DELAY
+                    deadline = asyncio.get_running_loop().time() + POLL_TIMEOUT_SECONDS
+                    while asyncio.get_running_loop().time() < deadline:
+                        status_resp = await client.get(status_url, params=params)
+                        if status_resp.status_code in (400, 422) and params:
+                            # Long-poll params not supported; fall back to plain polling
+                            params = {}
+                            continue
                         if status_resp.status_code == 200:
                             status_data = status_resp.json()
                             state = status_data.get("state")
@@ -47,7 +67,8 @@ async def run_workflow():
                                 print(f"Error: {status_data.get('error')}")
                                 break
                         
-                        await asyncio.sleep(5)
+                        await asyncio.sleep(delay)
+                        delay = min(POLL_MAX_DELAY, delay * 1.5)
             else:
                 print(f"\n❌ Failed to start workflow. Status: {response.status_code}")
                 print(f"Response: {response.text}")
@@ -5,33 +5,61 @@ Validates calendar JSON files against the CALENDAR_JSON_UPLOAD_FORMAT.md specifi
 Ensures compliance with required fields, data types, and business rules.
 """
 
-import json
-from datetime import datetime
+import calendar
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Tuple, Optional
-from pathlib import Path
+
+from common_json import json_loads
+
+# Accept exactly what strptime("%Y-%m-%d") / strptime("%H:%M") accept, without
+# strptime's per-call format parsing and datetime construction
+_DATE_RE = re.compile(r"(\d{4})-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])")
+_TIME_RE = re.compile(r"(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Distinguishes a missing key from one explicitly set to null
+_MISSING = object()
+
+
+def _parse_date_year(value: str) -> Optional[int]:
+    """Return the year of a valid YYYY-MM-DD date string, or None if it is not a real date."""
+    match = _DATE_RE.fullmatch(value)
+    if not match:
+        return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if year < 1:
+        return None
+    if day > _DAYS_IN_MONTH[month - 1] and not (month == 2 and day == 29 and calendar.isleap(year)):
+        return None
+    return year
 
 
 class CalendarFormatValidator:
     """Validator for calendar JSON format compliance."""
 
     # Valid campaign types from spec
-    VALID_EMAIL_TYPES = {
+    VALID_EMAIL_TYPES = frozenset({
         "email", "promotional", "content", "engagement",
         "seasonal", "special", "educational", "product_launch",
         "win_back", "nurture"
-    }
+    })
 
-    VALID_SMS_TYPES = {
+    VALID_SMS_TYPES = frozenset({
         "sms", "sms-promotional", "sms-content",
         "sms-engagement", "sms-seasonal", "sms-special"
-    }
+    })
 
-    VALID_PUSH_TYPES = {
+    VALID_PUSH_TYPES = frozenset({
         "push", "push-promotional", "push-reminder"
-    }
+    })
 
     VALID_TYPES = VALID_EMAIL_TYPES | VALID_SMS_TYPES | VALID_PUSH_TYPES
 
+    # Listing used in unknown-type errors, built once rather than per bad event
+    _VALID_TYPES_STR = ', '.join(sorted(VALID_TYPES))
+
     # Field length limits
     MAX_TITLE_LENGTH = 100
     MAX_DESCRIPTION_LENGTH = 2000
@@ -47,6 +75,28 @@ class CalendarFormatValidator:
     SEGMENT_ALTERNATIVES = {"segment", "segments"}
     SMS_VARIANT_ALTERNATIVES = {"secondary_message", "sms_variant"}
 
+    # TITLE_ALTERNATIVES in the order they are looked up; "title" first as the common case
+    _TITLE_FIELDS = ("title", "name", "subject_line_a")
+    _ERR_MISSING_TITLE = "Missing required 'title' field (or alternative: 'name', 'subject_line_a')"
+
+    # Optional free-text fields that should be strings when set
+    _TEXT_FIELDS = frozenset({
+        "subject_line_a", "subject_line_b", "preview_text",
+        "hero_h1", "sub_head", "hero_image", "cta_copy",
+        "offer", "ab_test_idea", "secondary_message", "sms_variant"
+    })
+
+    # Event array locations in an object root, in precedence order, with the
+    # error reported when the property is present but not an array
+    _EVENT_ARRAY_KEYS = (
+        ("events", "'events' property must be an array"),
+        ("calendar", "'calendar' property must be an array"),
+    )
+    _ERR_UNRECOGNIZED_FORMAT = (
+        "Unrecognized JSON format. Must be array or object with 'events' or 'calendar' property"
+    )
+    _ERR_INVALID_ROOT = "Invalid JSON root type. Must be array or object"
+
     def __init__(self):
         """Initialize validator."""
         self.errors: List[str] = []
@@ -62,47 +112,12 @@ class CalendarFormatValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.errors = []
-        self.warnings = []
-
-        try:
-            # Check file size
-            file_size_mb = Path(file_path).stat().st_size / (1024 * 1024)
-            if file_size_mb > self.MAX_FILE_SIZE_MB:
-                self.errors.append(
-                    f"File size {file_size_mb:.2f}MB exceeds maximum {self.MAX_FILE_SIZE_MB}MB"
-                )
-                return False, self.errors, self.warnings
-
-            # Load JSON
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-
-        except json.JSONDecodeError as e:
-            self.errors.append(f"Invalid JSON format: {e}")
-            return False, self.errors, self.warnings
-        except Exception as e:
-            self.errors.append(f"Error reading file: {e}")
-            return False, self.errors, self.warnings
-
-        # Validate structure and extract events
-        events = self._extract_events(data)
-        if not events:
-            return False, self.errors, self.warnings
-
-        # Validate event count
-        if len(events) > self.MAX_CAMPAIGNS_PER_FILE:
-            self.errors.append(
-                f"Number of campaigns ({len(events)}) exceeds maximum {self.MAX_CAMPAIGNS_PER_FILE}"
-            )
-            return False, self.errors, self.warnings
-
-        # Validate each event
-        for idx, event in enumerate(events, 1):
-            self._validate_event(event, idx)
-
-        is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
+        errors: List[str] = []
+        warnings: List[str] = []
+        is_valid = self._check_file(file_path, errors, warnings)
+        # Mirrored onto the instance for callers that read them afterwards
+        self.errors, self.warnings = errors, warnings
+        return is_valid, errors, warnings
 
     def validate_json_data(self, data: Any) -> Tuple[bool, List[str], List[str]]:
         """
@@ -114,29 +129,61 @@ class CalendarFormatValidator:
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.errors = []
-        self.warnings = []
+        errors: List[str] = []
+        warnings: List[str] = []
+        is_valid = self._check_data(data, errors, warnings)
+        # Mirrored onto the instance for callers that read them afterwards
+        self.errors, self.warnings = errors, warnings
+        return is_valid, errors, warnings
+
+    # The checks below keep no state on self: every call threads its own
+    # errors/warnings lists, so one validator can serve concurrent callers.
+
+    def _check_file(self, file_path: str, errors: List[str], warnings: List[str]) -> bool:
+        """Load and validate a JSON file, collecting problems into errors/warnings."""
+        try:
+            with open(file_path, 'rb') as f:
+                # Check file size on the open handle before reading anything
+                file_size_mb = os.fstat(f.fileno()).st_size / (1024 * 1024)
+                if file_size_mb > self.MAX_FILE_SIZE_MB:
+                    errors.append(
+                        f"File size {file_size_mb:.2f}MB exceeds maximum {self.MAX_FILE_SIZE_MB}MB"
+                    )
+                    return False
+
+                # Load JSON (size is capped above, so a single read is bounded)
+                data = json_loads(f.read())
+
+        except ValueError as e:  # JSONDecodeError from json/orjson/ujson
+            errors.append(f"Invalid JSON format: {e}")
+            return False
+        except Exception as e:
+            errors.append(f"Error reading file: {e}")
+            return False
+
+        return self._check_data(data, errors, warnings)
 
+    def _check_data(self, data: Any, errors: List[str], warnings: List[str]) -> bool:
+        """Validate parsed JSON data, collecting problems into errors/warnings."""
         # Validate structure and extract events
-        events = self._extract_events(data)
+        events = self._extract_events(data, errors)
         if not events:
-            return False, self.errors, self.warnings
+            return False
 
         # Validate event count
         if len(events) > self.MAX_CAMPAIGNS_PER_FILE:
-            self.errors.append(
+            errors.append(
                 f"Number of campaigns ({len(events)}) exceeds maximum {self.MAX_CAMPAIGNS_PER_FILE}"
             )
-            return False, self.errors, self.warnings
+            return False
 
         # Validate each event
         for idx, event in enumerate(events, 1):
-            self._validate_event(event, idx)
+            self._validate_event(event, idx, errors, warnings)
 
-        is_valid = len(self.errors) == 0
-        return is_valid, self.errors, self.warnings
+        return len(errors) == 0
 
-    def _extract_events(self, data: Any) -> Optional[List[Dict[str, Any]]]:
+    def _extract_events(self, data: Any, errors: List[str]) -> Optional[List[Dict[str, Any]]]:
         """
         Extract events array from JSON data, handling multiple formats.
 
@@ -147,194 +194,186 @@ class CalendarFormatValidator:
 
         Args:
             data: Parsed JSON data
+            errors: List to append structural errors to
 
         Returns:
             List of event dictionaries, or None if format invalid
         """
+        # Dict first: {"events": [...]} is by far the most common shape
+        if isinstance(data, dict):
+            return self._extract_from_dict(data, errors)
         if isinstance(data, list):
             # Direct array format
             return data
-        elif isinstance(data, dict):
-            if "events" in data:
-                if isinstance(data["events"], list):
-                    return data["events"]
-                else:
-                    self.errors.append("'events' property must be an array")
-                    return None
-            elif "calendar" in data:
-                if isinstance(data["calendar"], list):
-                    return data["calendar"]
-                else:
-                    self.errors.append("'calendar' property must be an array")
-                    return None
-            else:
-                self.errors.append(
-                    "Unrecognized JSON format. Must be array or object with 'events' or 'calendar' property"
-                )
+        errors.append(self._ERR_INVALID_ROOT)
+        return None
+
+    def _extract_from_dict(self, data: Dict[str, Any], errors: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Extract the events array from an object root ('events' wins over 'calendar')."""
+        for key, not_array_error in self._EVENT_ARRAY_KEYS:
+            events = data.get(key, _MISSING)
+            if events is not _MISSING:
+                if isinstance(events, list):
+                    return events
+                errors.append(not_array_error)
                 return None
-        else:
-            self.errors.append(
-                "Invalid JSON root type. Must be array or object"
-            )
-            return None
-
-    def _validate_event(self, event: Dict[str, Any], index: int) -> None:
+        errors.append(self._ERR_UNRECOGNIZED_FORMAT)
+        return None
+
+    def _validate_event(
+        self,
+        event: Dict[str, Any],
+        index: int,
+        errors: List[str],
+        warnings: List[str]
+    ) -> None:
         """
         Validate a single event object.
 
         Args:
             event: Event dictionary
             index: Event index (for error messages)
+            errors: List to append errors to
+            warnings: List to append warnings to
         """
         prefix = f"Event #{index}"
 
         if not isinstance(event, dict):
-            self.errors.append(f"{prefix}: Must be an object/dictionary")
+            errors.append(f"{prefix}: Must be an object/dictionary")
             return
 
         # Validate required fields
-        self._validate_date(event, prefix)
-        self._validate_title(event, prefix)
-        self._validate_type(event, prefix)
+        self._validate_date(event, prefix, errors)
+        self._validate_title(event, prefix, errors)
+        self._validate_type(event, prefix, errors)
 
         # Validate optional fields if present
         if "description" in event:
-            self._validate_description(event["description"], prefix)
+            self._validate_description(event["description"], prefix, warnings)
 
         if "week_number" in event:
-            self._validate_week_number(event["week_number"], prefix)
+            self._validate_week_number(event["week_number"], prefix, warnings)
 
         if "send_time" in event:
-            self._validate_send_time(event["send_time"], prefix)
-
-        # Validate field lengths for various text fields
-        text_fields = [
-            "subject_line_a", "subject_line_b", "preview_text",
-            "hero_h1", "sub_head", "hero_image", "cta_copy",
-            "offer", "ab_test_idea", "secondary_message", "sms_variant"
-        ]
-        for field in text_fields:
-            if field in event and event[field]:
-                if not isinstance(event[field], str):
-                    self.warnings.append(f"{prefix}: '{field}' should be a string")
-
-    def _validate_date(self, event: Dict[str, Any], prefix: str) -> None:
+            self._validate_send_time(event["send_time"], prefix, warnings)
+
+        # Validate types of the text fields actually present on the event
+        text_fields = self._TEXT_FIELDS
+        for field, value in event.items():
+            if value and field in text_fields and not isinstance(value, str):
+                warnings.append(f"{prefix}: '{field}' should be a string")
+
+    def _validate_date(self, event: Dict[str, Any], prefix: str, errors: List[str]) -> None:
         """Validate date field."""
         if "date" not in event and "send_date" not in event:
-            self.errors.append(f"{prefix}: Missing required 'date' field")
+            errors.append(f"{prefix}: Missing required 'date' field")
             return
 
         date_value = event.get("date") or event.get("send_date")
 
         if not isinstance(date_value, str):
-            self.errors.append(f"{prefix}: 'date' must be a string")
+            errors.append(f"{prefix}: 'date' must be a string")
             return
 
         # Validate YYYY-MM-DD format
-        try:
-            date_obj = datetime.strptime(date_value, "%Y-%m-%d")
-
-            # Validate year range
-            if not (self.MIN_YEAR <= date_obj.year <= self.MAX_YEAR):
-                self.errors.append(
-                    f"{prefix}: Year {date_obj.year} outside valid range "
-                    f"{self.MIN_YEAR}-{self.MAX_YEAR}"
-                )
-
-        except ValueError:
-            self.errors.append(
+        year = _parse_date_year(date_value)
+        if year is None:
+            errors.append(
                 f"{prefix}: Invalid date format '{date_value}'. Must be YYYY-MM-DD"
             )
+            return
+
+        # Validate year range
+        if not (self.MIN_YEAR <= year <= self.MAX_YEAR):
+            errors.append(
+                f"{prefix}: Year {year} outside valid range "
+                f"{self.MIN_YEAR}-{self.MAX_YEAR}"
+            )
 
-    def _validate_title(self, event: Dict[str, Any], prefix: str) -> None:
+    def _validate_title(self, event: Dict[str, Any], prefix: str, errors: List[str]) -> None:
         """Validate title field (or alternatives: name, subject_line_a)."""
-        title_field = None
-        title_value = None
-
-        # Check for title alternatives
-        for field in self.TITLE_ALTERNATIVES:
-            if field in event:
-                title_field = field
-                title_value = event[field]
+        # Check for title alternatives, in precedence order
+        for title_field in self._TITLE_FIELDS:
+            title_value = event.get(title_field, _MISSING)
+            if title_value is not _MISSING:
                 break
-
-        if not title_field:
-            self.errors.append(
-                f"{prefix}: Missing required 'title' field "
-                f"(or alternative: 'name', 'subject_line_a')"
-            )
+        else:
+            errors.append(f"{prefix}: {self._ERR_MISSING_TITLE}")
             return
 
         if not isinstance(title_value, str):
-            self.errors.append(f"{prefix}: '{title_field}' must be a string")
+            errors.append(f"{prefix}: '{title_field}' must be a string")
             return
 
         if not title_value.strip():
-            self.errors.append(f"{prefix}: '{title_field}' cannot be empty")
+            errors.append(f"{prefix}: '{title_field}' cannot be empty")
             return
 
         if len(title_value) > self.MAX_TITLE_LENGTH:
-            self.errors.append(
+            errors.append(
                 f"{prefix}: '{title_field}' exceeds maximum length "
                 f"{self.MAX_TITLE_LENGTH} characters (current: {len(title_value)})"
             )
 
-    def _validate_type(self, event: Dict[str, Any], prefix: str) -> None:
+    def _validate_type(self, event: Dict[str, Any], prefix: str, errors: List[str]) -> None:
         """Validate type field."""
         if "type" not in event:
-            self.errors.append(f"{prefix}: Missing required 'type' field")
+            errors.append(f"{prefix}: Missing required 'type' field")
             return
 
         type_value = event["type"]
 
         if not isinstance(type_value, str):
-            self.errors.append(f"{prefix}: 'type' must be a string")
+            errors.append(f"{prefix}: 'type' must be a string")
             return
 
         if type_value not in self.VALID_TYPES:
-            self.errors.append(
+            errors.append(
                 f"{prefix}: Unknown campaign type '{type_value}'. "
-                f"Valid types: {', '.join(sorted(self.VALID_TYPES))}"
+                f"Valid types: {self._VALID_TYPES_STR}"
             )
 
-    def _validate_description(self, description: Any, prefix: str) -> None:
+    def _validate_description(self, description: Any, prefix: str, warnings: List[str]) -> None:
         """Validate description field."""
         if not isinstance(description, str):
-            self.warnings.append(f"{prefix}: 'description' should be a string")
+            warnings.append(f"{prefix}: 'description' should be a string")
             return
 
         if len(description) > self.MAX_DESCRIPTION_LENGTH:
-            self.warnings.append(
+            warnings.append(
                 f"{prefix}: 'description' exceeds recommended length "
                 f"{self.MAX_DESCRIPTION_LENGTH} characters (current: {len(description)})"
             )
 
-    def _validate_week_number(self, week_number: Any, prefix: str) -> None:
+    def _validate_week_number(self, week_number: Any, prefix: str, warnings: List[str]) -> None:
         """Validate week_number field."""
         if not isinstance(week_number, int):
-            self.warnings.append(f"{prefix}: 'week_number' should be an integer")
+            warnings.append(f"{prefix}: 'week_number' should be an integer")
             return
 
         if not (1 <= week_number <= 53):
-            self.warnings.append(
+            warnings.append(
                 f"{prefix}: 'week_number' {week_number} outside typical range 1-53"
             )
 
-    def _validate_send_time(self, send_time: Any, prefix: str) -> None:
+    def _validate_send_time(self, send_time: Any, prefix: str, warnings: List[str]) -> None:
         """Validate send_time field (HH:MM format)."""
         if not isinstance(send_time, str):
-            self.warnings.append(f"{prefix}: 'send_time' should be a string")
+            warnings.append(f"{prefix}: 'send_time' should be a string")
             return
 
-        try:
-            datetime.strptime(send_time, "%H:%M")
-        except ValueError:
-            self.warnings.append(
+        if not _TIME_RE.fullmatch(send_time):
+            warnings.append(
                 f"{prefix}: Invalid 'send_time' format '{send_time}'. "
                 "Should be HH:MM (24-hour format)"
             )
 
 
+# Shared by the convenience functions below. Validation keeps its errors and
+# warnings per call, so one instance is safe to reuse across calls and threads.
+_DEFAULT_VALIDATOR = CalendarFormatValidator()
+
+
 def validate_calendar_json(file_path: str) -> Tuple[bool, List[str], List[str]]:
     """
     Convenience function to validate a calendar JSON file.
@@ -345,8 +384,7 @@ def validate_calendar_json(file_path: str) -> Tuple[bool, List[str], List[str]]:
     Returns:
         Tuple of (is_valid, errors, warnings)
     """
-    validator = CalendarFormatValidator()
-    return validator.validate_json_file(file_path)
+    return _DEFAULT_VALIDATOR.validate_json_file(file_path)
 
 
 def validate_calendar_data(data: Any) -> Tuple[bool, List[str], List[str]]:
@@ -359,5 +397,30 @@ def validate_calendar_data(data: Any) -> Tuple[bool, List[str], List[str]]:
     Returns:
         Tuple of (is_valid, errors, warnings)
     """
-    validator = CalendarFormatValidator()
-    return validator.validate_json_data(data)
+    return _DEFAULT_VALIDATOR.validate_json_data(data)
+
+
+def validate_many(
+    file_paths: List[str],
+    workers: Optional[int] = None
+) -> Dict[str, Tuple[bool, List[str], List[str]]]:
+    """
+    Validate many calendar JSON files in parallel worker processes.
+
+    Parsing and validation are CPU-bound, so files are spread across a
+    process pool rather than threads.
+
+    Args:
+        file_paths: Paths to JSON files
+        workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        Dict mapping each path to its (is_valid, errors, warnings) tuple
+    """
+    if not file_paths:
+        return {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(file_paths) // ((workers or os.cpu_count() or 1) * 4))
+        results = executor.map(validate_calendar_json, file_paths, chunksize=chunksize)
+        return dict(zip(file_paths, results))
@@ -5,18 +5,43 @@ Provides a structured interface to the CalendarAgent workflow
 with validation, error handling, and logging.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
-import json
 from pathlib import Path
 
+from common_json import json_dumps_indented
 from agents.calendar_agent import CalendarAgent
-from tools.validator import CalendarValidator
+from tools.validator import CalendarValidator, parse_iso_date
 from tools.format_adapter import CalendarFormatAdapter
 
 logger = logging.getLogger(__name__)
 
+# Letters/digits with hyphens/underscores, at least one letter or digit (same rule as
+# str.isalnum() after stripping "-" and "_", without the intermediate strings)
+_CLIENT_NAME_RE = re.compile(r"[-_]*[^\W_][\w-]*")
+
+# Recent app-format transforms kept per CalendarTool (oldest evicted first)
+APP_FORMAT_CACHE_SIZE = 5
+
+
+def _write_bytes_once(path: str, data: bytes) -> None:
+    """Write a complete payload to a file through a raw fd, bypassing buffered I/O."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 class CalendarTool:
     """
@@ -34,7 +59,9 @@ class CalendarTool:
         self,
         calendar_agent: CalendarAgent,
         output_dir: Optional[str] = None,
-        validate_outputs: bool = True
+        validate_outputs: bool = True,
+        result_cache_size: int = 0,
+        result_cache_ttl: float = 900.0
     ):
         """
         Initialize Calendar Tool.
@@ -43,6 +70,9 @@ class CalendarTool:
             calendar_agent: Configured CalendarAgent instance
             output_dir: Directory to save workflow outputs (optional)
             validate_outputs: Whether to validate outputs after each stage
+            result_cache_size: Number of fully validated workflow results to keep
+                               for repeat runs (default 0: disabled)
+            result_cache_ttl: Seconds a cached result may be reused
         """
         self.agent = calendar_agent
         self.validator = CalendarValidator()
@@ -50,13 +80,35 @@ class CalendarTool:
         self.output_dir = Path(output_dir) if output_dir else None
         self.validate_outputs = validate_outputs
 
+        # Fully validated workflow results keyed by client/date range, least recently used first
+        # Entries are (monotonic time stored, result)
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_ttl = result_cache_ttl
+
+        # Serialized app-format calendars keyed by (client_id, calendar content hash)
+        self._app_format_cache: Dict[Tuple[str, str], bytes] = {}
+
         # Create output directory if specified
         if self.output_dir:
             self.output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Output directory: {self.output_dir}")
+            logger.info("Output directory: %s", self.output_dir)
 
         logger.info("CalendarTool initialized")
 
+    @staticmethod
+    def _quick_valid(client_name: str, start_date: str, end_date: str) -> bool:
+        """Return True if the inputs pass every check in validate_inputs, stopping at the first failure."""
+        if not isinstance(client_name, str) or not _CLIENT_NAME_RE.fullmatch(client_name):
+            return False
+        start_dt = parse_iso_date(start_date)
+        if start_dt is None:
+            return False
+        end_dt = parse_iso_date(end_date)
+        if end_dt is None:
+            return False
+        return 0 < (end_dt - start_dt).days <= 90
+
     def validate_inputs(
         self,
         client_name: str,
@@ -74,44 +126,45 @@ class CalendarTool:
         Returns:
             Tuple of (is_valid, error_messages)
         """
+        # Common case: valid inputs need no error collection
+        if self._quick_valid(client_name, start_date, end_date):
+            logger.info("Input validation passed for %s (%s to %s)", client_name, start_date, end_date)
+            return True, []
+
         errors = []
 
         # Validate client_name
         if not client_name or not isinstance(client_name, str):
             errors.append("client_name must be a non-empty string")
-        elif not client_name.replace("-", "").replace("_", "").isalnum():
+        elif not _CLIENT_NAME_RE.fullmatch(client_name):
             errors.append("client_name must be alphanumeric with hyphens/underscores only")
 
-        # Validate dates
-        if not self.validator._is_valid_date(start_date):
+        # Validate dates (each parsed once and reused for the range check)
+        start_dt = parse_iso_date(start_date)
+        end_dt = parse_iso_date(end_date)
+
+        if start_dt is None:
             errors.append(f"Invalid start_date format: {start_date} (expected YYYY-MM-DD)")
 
-        if not self.validator._is_valid_date(end_date):
+        if end_dt is None:
             errors.append(f"Invalid end_date format: {end_date} (expected YYYY-MM-DD)")
 
         # Check date range
-        if start_date and end_date:
-            try:
-                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-                if end_dt <= start_dt:
-                    errors.append("end_date must be after start_date")
-
-                # Check for reasonable range (max 3 months)
-                days_diff = (end_dt - start_dt).days
-                if days_diff > 90:
-                    errors.append(f"Date range too large: {days_diff} days (max 90 days)")
+        if start_dt and end_dt:
+            if end_dt <= start_dt:
+                errors.append("end_date must be after start_date")
 
-            except ValueError:
-                pass  # Date format errors already caught above
+            # Check for reasonable range (max 3 months)
+            days_diff = (end_dt - start_dt).days
+            if days_diff > 90:
+                errors.append(f"Date range too large: {days_diff} days (max 90 days)")
 
         is_valid = len(errors) == 0
 
         if is_valid:
-            logger.info(f"Input validation passed for {client_name} ({start_date} to {end_date})")
+            logger.info("Input validation passed for %s (%s to %s)", client_name, start_date, end_date)
         else:
-            logger.error(f"Input validation failed: {errors}")
+            logger.error("Input validation failed: %s", errors)
 
         return is_valid, errors
 
@@ -148,13 +201,13 @@ class CalendarTool:
             }
         """
         workflow_id = f"{client_name}_{start_date}_{end_date}"
-        logger.info(f"Starting workflow: {workflow_id}")
+        logger.info("Starting workflow: %s", workflow_id)
 
         # Validate inputs
         inputs_valid, input_errors = self.validate_inputs(client_name, start_date, end_date)
 
         if not inputs_valid:
-            logger.error(f"Workflow aborted due to invalid inputs: {input_errors}")
+            logger.error("Workflow aborted due to invalid inputs: %s", input_errors)
             return {
                 "success": False,
                 "error": "Input validation failed",
@@ -170,6 +223,15 @@ class CalendarTool:
                 }
             }
 
+        # Serve a repeat run from a previously validated result
+        cache_key = self._result_cache_key(client_name, start_date, end_date)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("Workflow %s served from result cache", workflow_id)
+            if save_outputs and self.output_dir:
+                await self._save_outputs(workflow_id, cached, cached["validation"])
+            return cached
+
         try:
             # Run the workflow
             result = await self.agent.run_workflow(client_name, start_date, end_date)
@@ -227,7 +289,7 @@ class CalendarTool:
 
             # Save outputs if requested
             if save_outputs and self.output_dir:
-                self._save_outputs(workflow_id, result, validation_results)
+                await self._save_outputs(workflow_id, result, validation_results)
 
             # Compile final result
             final_result = {
@@ -240,18 +302,22 @@ class CalendarTool:
             }
 
             if all_valid:
-                logger.info(f"Workflow {workflow_id} completed successfully")
+                logger.info("Workflow %s completed successfully", workflow_id)
+                # Only results that passed every validator are reused
+                if self.validate_outputs:
+                    self._cache_result(cache_key, final_result)
             else:
                 logger.warning(
-                    f"Workflow {workflow_id} completed with validation issues: "
-                    f"{len(validation_results['errors'])} errors, "
-                    f"{len(validation_results['warnings'])} warnings"
+                    "Workflow %s completed with validation issues: %d errors, %d warnings",
+                    workflow_id,
+                    len(validation_results['errors']),
+                    len(validation_results['warnings'])
                 )
 
             return final_result
 
         except Exception as e:
-            logger.error(f"Workflow {workflow_id} failed with exception: {str(e)}", exc_info=True)
+            logger.error("Workflow %s failed with exception: %s", workflow_id, e, exc_info=True)
 
             return {
                 "success": False,
@@ -265,7 +331,82 @@ class CalendarTool:
                 }
             }
 
-    def _save_outputs(
+    @staticmethod
+    def _result_cache_key(client_name: str, start_date: str, end_date: str) -> str:
+        """Build the result cache key for a workflow run."""
+        return f"{client_name}|{start_date}|{end_date}"
+
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of an unexpired cached result, or None on miss."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self._result_cache_ttl:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _cache_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a validated result, evicting the least recently used entry."""
+        if self._result_cache_size <= 0:
+            return
+        self._result_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def invalidate(self, client_name: str, start_date: str, end_date: str) -> bool:
+        """
+        Drop a cached workflow result so the next run regenerates it.
+
+        Args:
+            client_name: Client slug
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            True if a cached result was removed
+        """
+        key = self._result_cache_key(client_name, start_date, end_date)
+        return self._result_cache.pop(key, None) is not None
+
+    def _app_format_bytes(
+        self,
+        calendar_json: Dict[str, Any],
+        calendar_bytes: bytes,
+        client_id: str
+    ) -> bytes:
+        """
+        Transform a calendar to app format and serialize it, reusing recent results.
+
+        Args:
+            calendar_json: Calendar to transform
+            calendar_bytes: Serialized calendar_json, hashed to key the cache
+            client_id: Client ID for the app format
+
+        Returns:
+            Indented app-format JSON bytes
+        """
+        key = (client_id, hashlib.blake2b(calendar_bytes, digest_size=16).hexdigest())
+        cached = self._app_format_cache.get(key)
+        if cached is not None:
+            return cached
+
+        app_calendar = self.format_adapter.transform_to_app_format(
+            calendar_json,
+            client_id=client_id
+        )
+        app_bytes = json_dumps_indented(app_calendar)
+
+        self._app_format_cache[key] = app_bytes
+        if len(self._app_format_cache) > APP_FORMAT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._app_format_cache[next(iter(self._app_format_cache))]
+        return app_bytes
+
+    async def _save_outputs(
         self,
         workflow_id: str,
         result: Dict[str, Any],
@@ -274,6 +415,9 @@ class CalendarTool:
         """
         Save workflow outputs to files.
 
+        Output files are written concurrently in worker threads so the
+        event loop is not blocked on disk I/O.
+
         Args:
             workflow_id: Workflow identifier
             result: Workflow result
@@ -283,53 +427,72 @@ class CalendarTool:
             return
 
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        base_path = self.output_dir / f"{workflow_id}_{timestamp}"
+        # Plain string prefix; each output path is a single f-string from it
+        base_path = os.path.join(os.fspath(self.output_dir), f"{workflow_id}_{timestamp}")
 
-        try:
-            # Save planning output
-            if result.get("planning"):
-                planning_path = f"{base_path}_planning.txt"
-                with open(planning_path, 'w', encoding='utf-8') as f:
-                    f.write(result["planning"])
-                logger.info(f"Saved planning output: {planning_path}")
-
-            # Save calendar JSON
-            if result.get("calendar_json"):
-                calendar_path = f"{base_path}_calendar.json"
-                with open(calendar_path, 'w', encoding='utf-8') as f:
-                    json.dump(result["calendar_json"], f, indent=2)
-                logger.info(f"Saved calendar JSON: {calendar_path}")
-
-            # Transform and save app format
-            if result.get("calendar_json"):
-                try:
-                    client_id = workflow_id.split('_')[0]  # Extract client name
-                    app_calendar = self.format_adapter.transform_to_app_format(
-                        result["calendar_json"],
-                        client_id=client_id
-                    )
-                    app_path = f"{base_path}_calendar_app.json"
-                    with open(app_path, 'w', encoding='utf-8') as f:
-                        json.dump(app_calendar, f, indent=2)
-                    logger.info(f"Saved app format calendar: {app_path}")
-                except Exception as e:
-                    logger.error(f"Failed to save app format: {str(e)}")
-
-            # Save briefs output
-            if result.get("briefs"):
-                briefs_path = f"{base_path}_briefs.txt"
-                with open(briefs_path, 'w', encoding='utf-8') as f:
-                    f.write(result["briefs"])
-                logger.info(f"Saved briefs output: {briefs_path}")
-
-            # Save validation report
-            validation_path = f"{base_path}_validation.json"
-            with open(validation_path, 'w', encoding='utf-8') as f:
-                json.dump(validation, f, indent=2)
-            logger.info(f"Saved validation report: {validation_path}")
+        # (description, path, content) for each output file
+        writes = []
 
-        except Exception as e:
-            logger.error(f"Failed to save outputs: {str(e)}")
+        def add(description: str, path: str, serialize: Callable[[], bytes]) -> Optional[bytes]:
+            """Serialize one output file; a failure is logged and skips only that file."""
+            try:
+                content = serialize()
+            except Exception as e:
+                logger.error("Failed to save %s: %s", description, e)
+                return None
+            writes.append((description, path, content))
+            return content
+
+        # Planning output
+        if result.get("planning"):
+            add(
+                "planning output",
+                f"{base_path}_planning.txt",
+                lambda: result["planning"].encode('utf-8')
+            )
+
+        if result.get("calendar_json"):
+            # Calendar JSON
+            calendar_bytes = add(
+                "calendar JSON",
+                f"{base_path}_calendar.json",
+                lambda: json_dumps_indented(result["calendar_json"])
+            )
+
+            # Transform to app format (keyed on the calendar bytes, so only once those serialized)
+            if calendar_bytes is not None:
+                client_id = workflow_id.split('_')[0]  # Extract client name
+                add(
+                    "app format calendar",
+                    f"{base_path}_calendar_app.json",
+                    lambda: self._app_format_bytes(result["calendar_json"], calendar_bytes, client_id)
+                )
+
+        # Briefs output
+        if result.get("briefs"):
+            add(
+                "briefs output",
+                f"{base_path}_briefs.txt",
+                lambda: result["briefs"].encode('utf-8')
+            )
+
+        # Validation report
+        add(
+            "validation report",
+            f"{base_path}_validation.json",
+            lambda: json_dumps_indented(validation)
+        )
+
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_write_bytes_once, path, content) for _, path, content in writes),
+            return_exceptions=True
+        )
+
+        for (description, path, _), outcome in zip(writes, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to save %s: %s", description, outcome)
+            else:
+                logger.info("Saved %s: %s", description, path)
 
     async def run_stage(
         self,
@@ -356,7 +519,7 @@ class CalendarTool:
         """
         workflow_id = f"{client_name}_{start_date}_{end_date}"
 
-        logger.info(f"Running stage {stage} for {workflow_id}")
+        logger.info("Running stage %s for %s", stage, workflow_id)
 
         try:
             if stage == 1:
@@ -389,7 +552,7 @@ class CalendarTool:
                 raise ValueError(f"Invalid stage: {stage} (must be 1, 2, or 3)")
 
         except Exception as e:
-            logger.error(f"Stage {stage} failed: {str(e)}", exc_info=True)
+            logger.error("Stage %s failed: %s", stage, e, exc_info=True)
             return {
                 "stage": stage,
                 "success": False,
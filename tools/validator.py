@@ -6,12 +6,46 @@ Ensures all required fields are present and properly formatted.
 """
 
 import logging
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _parse_iso_date_cached(date_str: str) -> Optional[datetime]:
+    # fromisoformat is a C fast path for the canonical zero-padded form; anything
+    # else (e.g. "2026-1-5") falls back to strptime so accepted input is unchanged
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-" and date_str.isascii():
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def parse_iso_date(date_str: Any) -> Optional[datetime]:
+    """
+    Parse a YYYY-MM-DD date string.
+
+    Results are cached, since the same workflow dates are validated on
+    every stage run.
+
+    Args:
+        date_str: Date string to parse
+
+    Returns:
+        Parsed datetime, or None if not a valid YYYY-MM-DD date
+    """
+    if not isinstance(date_str, str):
+        return None
+    return _parse_iso_date_cached(date_str)
+
+
 class CalendarValidator:
     """
     Validator for v4.0.0 calendar JSON format.
@@ -180,11 +214,7 @@ class CalendarValidator:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except (ValueError, TypeError):
-            return False
+        return parse_iso_date(date_str) is not None
 
     def _is_valid_time(self, time_str: str) -> bool:
         """